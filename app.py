@@ -1,21 +1,89 @@
-from flask import Flask, render_template, jsonify, redirect, url_for, request, session
+from flask import Flask, render_template, jsonify, redirect, url_for, request, session, g, make_response
 from flask_sqlalchemy import SQLAlchemy
-from sqlalchemy import func
-from datetime import datetime
-from threading import Lock
+from flask_migrate import Migrate
+from sqlalchemy import (
+    func, case, and_, or_, insert, update, select, union_all, literal, null, cast, create_engine, event,
+)
+from sqlalchemy.orm import sessionmaker, aliased
+from sqlalchemy.exc import SQLAlchemyError, IntegrityError
+from datetime import date, datetime, timedelta, timezone
+from collections import OrderedDict
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from threading import Event, Lock, Thread
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import NamedTuple
 import requests
+from requests.adapters import HTTPAdapter
 import os
+import re
+import sys
 import json
+import gzip
+import socket
+import sqlite3
+import random
+import time
+import itertools
+import hashlib
+import queue
+import uuid
 
-import plotly.graph_objs as go
-from plotly.utils import PlotlyJSONEncoder
 from werkzeug.security import generate_password_hash, check_password_hash
 
+try:
+    # Optional: incremental JSON parsing for streamed ledger pages
+    import ijson
+except ImportError:  # pragma: no cover - depends on deployment
+    ijson = None
+
+try:
+    # Optional: brotli response compression
+    import brotli
+except ImportError:  # pragma: no cover - depends on deployment
+    brotli = None
+
+try:
+    # Optional: vectorized profit accrual across all investors
+    import numpy as np
+except ImportError:  # pragma: no cover - depends on deployment
+    np = None
+
 from config import (
     MANAGER_API_BASE_URL,
     MANAGER_API_KEY,
     API_TIMEOUT_SECONDS as CFG_API_TIMEOUT_SECONDS,
+    API_ENDPOINT_TIMEOUTS,
+    API_MAX_RETRIES,
+    API_BACKOFF_BASE_SECONDS,
+    API_BACKOFF_MAX_SECONDS,
+    API_POOL_SIZE,
+    API_PAGE_SIZE,
+    API_PREFETCH_NEXT_PAGE,
+    API_STREAM_LEDGER_LINES,
     UPDATE_INTERVAL_SECONDS as CFG_UPDATE_INTERVAL_SECONDS,
+    SYNC_SCHEDULER_ENABLED,
+    SYNC_JITTER_SECONDS,
+    SYNC_DEBOUNCE_SECONDS,
+    SYNC_LEASE_SECONDS,
+    SQLITE_PROFILE,
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_MMAP_SIZE,
+    SQLITE_CACHE_SIZE_KB,
+    SQLITE_READ_POOL_SIZE,
+    RESULT_CACHE_BACKEND,
+    RESULT_CACHE_PATH,
+    RESULT_CACHE_MAX_ENTRIES,
+    RESULT_CACHE_TOUCH_SECONDS,
+    BUILD_VERSION,
+    COMPRESSION_ENABLED,
+    COMPRESS_MIN_BYTES,
+    DELTA_SYNC_ENABLED,
+    FULL_RESYNC_INTERVAL_SECONDS,
+    DETAIL_FETCH_CONCURRENCY,
+    LEDGER_CLASSIFIER_CACHE_SIZE,
+    PROFIT_ACCRUAL_VECTORIZED,
     FIELD_IDS,
 )
 
@@ -25,17 +93,55 @@ app.secret_key = os.environ.get("IMS_SECRET_KEY", "change-me-in-production")
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///investors.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 db = SQLAlchemy(app)
+migrate = Migrate(app, db)  # `flask db upgrade` applies migrations/
+
+# SQLite connection profiles: PRAGMAs run on every new connection.
+SQLITE_PROFILES = {
+    "default": (),
+    "tuned": (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}",
+        f"PRAGMA cache_size=-{SQLITE_CACHE_SIZE_KB}",
+    ),
+}
+
+
+def _sqlite_profile_listener(pragmas, query_only=False):
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        if query_only:
+            cursor.execute("PRAGMA query_only=ON")
+        cursor.close()
+    return on_connect
+
+
+# Read-only sessions for request handlers (see read_session()); only used
+# by the tuned profile, where WAL lets them read while a sync writes.
+ReadSession = None
+with app.app_context():
+    if db.engine.dialect.name == "sqlite":
+        if SQLITE_PROFILE not in SQLITE_PROFILES:
+            raise ValueError(f"Unknown IMS_SQLITE_PROFILE {SQLITE_PROFILE!r}")
+        event.listen(db.engine, "connect", _sqlite_profile_listener(SQLITE_PROFILES[SQLITE_PROFILE]))
+        if SQLITE_PROFILE != "default":
+            read_engine = create_engine(db.engine.url, pool_size=SQLITE_READ_POOL_SIZE)
+            event.listen(
+                read_engine, "connect",
+                _sqlite_profile_listener(SQLITE_PROFILES[SQLITE_PROFILE], query_only=True),
+            )
+            ReadSession = sessionmaker(bind=read_engine)
 
-# Synchronization control (to avoid concurrent DB writes / locks)
+# Synchronization control (to avoid concurrent DB writes / locks).
+# Across processes, syncs are serialised by the lease in SyncState and the
+# last sync time is SyncState.published_at.
 db_update_lock = Lock()
-last_update_time = None  # UTC datetime of last successful sync
 UPDATE_INTERVAL_SECONDS = CFG_UPDATE_INTERVAL_SECONDS  # max refresh interval from config
 DETAIL_DEBUG_COUNT = 0  # limit verbose logging for detail calls
-
-# In-memory cache for investment summary so we don't hit
-# Manager.io APIs on every /investment_summary request.
-summary_cache = None
-summary_last_update = None  # UTC datetime of last summary build
+DETAIL_DEBUG_LOCK = Lock()  # detail calls run on the ims-detail thread pool
 
 # External API configuration (Manager.io adapter)
 API_BASE_URL = MANAGER_API_BASE_URL
@@ -62,7 +168,11 @@ OLD_PROFIT_ID = FIELD_IDS["profit_old"]
 # ---------------------------
 class Investor(db.Model):
     id = db.Column(db.Integer, primary_key=True)
+    # Manager.io special-account key; the stable identity used by the sync
+    account_key = db.Column(db.String(64), unique=True, index=True, nullable=True)
     name = db.Column(db.String(200), nullable=False)
+    # Dashboard group: investor name without code / phase (investor_group_key)
+    base_name = db.Column(db.String(200), nullable=True, index=True)
     start_date = db.Column(db.String(10), nullable=True)
     end_date = db.Column(db.String(10), nullable=True)
     duration_months = db.Column(db.Integer, nullable=True)
@@ -76,6 +186,145 @@ class Investor(db.Model):
     dividend_paid = db.Column(db.Float, default=0)
 
 
+class LedgerAccount(db.Model):
+    """
+    Investor special-account balance (Loans payable / Profit payable)
+    as of the last sync.
+    """
+    id = db.Column(db.Integer, primary_key=True)
+    control_account = db.Column(db.String(50), nullable=False)
+    name = db.Column(db.String(200), nullable=False)
+    base_name = db.Column(db.String(200), nullable=False, index=True)
+    phase_label = db.Column(db.String(100), nullable=False)
+    display_name = db.Column(db.String(200), nullable=False)
+    balance = db.Column(db.Float, nullable=False, default=0)
+
+
+class LedgerLine(db.Model):
+    """
+    A receipt, payment or journal-entry line posted to an investor's
+    Loans payable / Profit payable / Dividend payable account, stored
+    locally so summaries can be built without calling Manager.io.
+    """
+    id = db.Column(db.Integer, primary_key=True)
+    source = db.Column(db.String(10), nullable=False)  # receipt / payment / journal
+    account_kind = db.Column(db.String(10), nullable=False)  # loans / profit / dividend
+    investor_name = db.Column(db.String(200), nullable=False)
+    base_name = db.Column(db.String(200), nullable=False)
+    phase_label = db.Column(db.String(100), nullable=False)
+    display_name = db.Column(db.String(200), nullable=False)
+    date = db.Column(db.String(10), nullable=True)
+    amount = db.Column(db.Float, nullable=False, default=0)
+    debit = db.Column(db.Float, nullable=False, default=0)
+    credit = db.Column(db.Float, nullable=False, default=0)
+
+    __table_args__ = (
+        db.Index("ix_ledger_line_investor", "base_name", "phase_label", "date"),
+    )
+
+
+class LedgerLineStaging(db.Model):
+    """
+    Ledger lines read by a sync that has not been published yet. Lines are
+    written here in batches as they stream in, so a sync never holds the
+    whole download in memory; publish_sync moves its own rows (by
+    `sync_id`) into ledger_line.
+    """
+    id = db.Column(db.Integer, primary_key=True)
+    sync_id = db.Column(db.String(32), nullable=False, index=True)
+    source = db.Column(db.String(10), nullable=False)
+    account_kind = db.Column(db.String(10), nullable=False)
+    investor_name = db.Column(db.String(200), nullable=False)
+    base_name = db.Column(db.String(200), nullable=False)
+    phase_label = db.Column(db.String(100), nullable=False)
+    display_name = db.Column(db.String(200), nullable=False)
+    date = db.Column(db.String(10), nullable=True)
+    amount = db.Column(db.Float, nullable=False, default=0)
+    debit = db.Column(db.Float, nullable=False, default=0)
+    credit = db.Column(db.Float, nullable=False, default=0)
+
+
+class SyncWatermark(db.Model):
+    """
+    How far each ledger line collection has been downloaded: the number of
+    API records consumed, a fingerprint of the last one and the latest line
+    date seen. Used by delta syncs to fetch only newer lines.
+    """
+    source = db.Column(db.String(10), primary_key=True)  # receipt / payment / journal
+    position = db.Column(db.Integer, nullable=False, default=0)
+    last_key = db.Column(db.String(64), nullable=True)
+    last_date = db.Column(db.String(10), nullable=True)
+    full_synced_at = db.Column(db.DateTime, nullable=True)
+    updated_at = db.Column(db.DateTime, nullable=True)
+
+
+SYNC_STATE_ID = 1
+
+
+class SyncState(db.Model):
+    """
+    Single-row pointer to the published sync generation. A sync that
+    changes the published data bumps `generation` and `published_at` in
+    the same transaction; every completed sync sets `checked_at`.
+    `lease_holder` / `lease_expires_at` elect the one process allowed
+    to sync at a time. `accrued_on` is the local date the time-dependent
+    Investor columns were last computed for (see refresh_accruals).
+    """
+    id = db.Column(db.Integer, primary_key=True)
+    generation = db.Column(db.Integer, nullable=False, default=0)
+    published_at = db.Column(db.DateTime, nullable=True)
+    checked_at = db.Column(db.DateTime, nullable=True)
+    accrued_on = db.Column(db.Date, nullable=True)
+    lease_holder = db.Column(db.String(128), nullable=True)
+    lease_expires_at = db.Column(db.DateTime, nullable=True)
+
+
+class SummaryGroup(db.Model):
+    """
+    Materialized /investment_summary row for one investor (base name),
+    rebuilt by every sync in the same transaction that publishes it.
+    `position` is the display order (largest Loans payable balance first).
+    Ids keep counting up across syncs, so a phase row never matches a
+    group id another investor had in an earlier generation.
+    """
+    id = db.Column(db.Integer, primary_key=True)
+    position = db.Column(db.Integer, nullable=False, index=True)
+    name = db.Column(db.String(200), nullable=False, unique=True)
+    search_name = db.Column(db.String(200), nullable=False, index=True)  # name.lower(), for ?q=
+    current_balance_loans = db.Column(db.Float, nullable=False, default=0)
+    current_balance_profit = db.Column(db.Float, nullable=False, default=0)
+    total_received = db.Column(db.Float, nullable=False, default=0)
+    principal_repaid = db.Column(db.Float, nullable=False, default=0)
+    profit_paid = db.Column(db.Float, nullable=False, default=0)
+    computed_balance = db.Column(db.Float, nullable=False, default=0)
+    balance_match = db.Column(db.Boolean, nullable=False, default=False)
+    first_receipt_date = db.Column(db.String(10), nullable=True)
+    last_receipt_date = db.Column(db.String(10), nullable=True)
+
+    # Joined into the groups query: one SELECT, so groups and phases are
+    # read from the same snapshot even when a sync publishes meanwhile.
+    phases_list = db.relationship(
+        "SummaryPhase", order_by="SummaryPhase.position", lazy="joined", viewonly=True
+    )
+
+
+class SummaryPhase(db.Model):
+    """Materialized per-phase row of a SummaryGroup, ordered by name."""
+    id = db.Column(db.Integer, primary_key=True)
+    group_id = db.Column(db.Integer, db.ForeignKey("summary_group.id"), nullable=False, index=True)
+    position = db.Column(db.Integer, nullable=False)
+    name = db.Column(db.String(200), nullable=False)
+    phase_label = db.Column(db.String(100), nullable=True)
+    current_balance_loans = db.Column(db.Float, nullable=False, default=0)
+    current_balance_profit = db.Column(db.Float, nullable=False, default=0)
+    total_received = db.Column(db.Float, nullable=False, default=0)
+    principal_repaid = db.Column(db.Float, nullable=False, default=0)
+    profit_paid = db.Column(db.Float, nullable=False, default=0)
+    computed_balance = db.Column(db.Float, nullable=False, default=0)
+    first_receipt_date = db.Column(db.String(10), nullable=True)
+    last_receipt_date = db.Column(db.String(10), nullable=True)
+
+
 class AdminUser(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(150), unique=True, nullable=False)
@@ -84,6 +333,10 @@ class AdminUser(db.Model):
 # ---------------------------
 # Fetching Functions
 # ---------------------------
+class ManagerAPIError(requests.RequestException):
+    """Raised when Manager.io answers a list page with a non-200 status."""
+
+
 def _api_headers(include_accept_json: bool = True) -> dict:
     headers = {}
     if include_accept_json:
@@ -93,29 +346,310 @@ def _api_headers(include_accept_json: bool = True) -> dict:
     return headers
 
 
-def fetch_special_accounts():
-    url = f"{API_BASE_URL}/special-accounts"
-    try:
-        # Use a large pageSize to ensure we fetch all special accounts,
-        # not just the first page.
-        response = requests.get(
-            url,
-            headers=_api_headers(),
-            params={"pageSize": 9999},
-            timeout=API_TIMEOUT_SECONDS,
-        )
-        if response.status_code == 200:
-            return response.json().get("specialAccounts", [])
+class _ChunkReader:
+    """Minimal file-like view over an iterator of byte chunks (for ijson)."""
+
+    def __init__(self, chunks):
+        self._chunks = chunks
+        self._buffer = b""
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self._buffer) < size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            self._buffer += chunk
+        if size < 0:
+            data, self._buffer = self._buffer, b""
         else:
-            print(f"[AIOSOL] special-accounts HTTP {response.status_code}: {response.text[:500]}")
-    except requests.RequestException as exc:
-        print(f"[AIOSOL] Error fetching special accounts: {exc}")
-    return []
+            data, self._buffer = self._buffer[:size], self._buffer[size:]
+        return data
+
+
+def _has_more_pages(skip: int, count: int, page_size: int, total) -> bool:
+    """
+    Whether a list endpoint has records past `skip`, after a page of
+    `count`. totalRecords decides when the response has it: the server may
+    cap pageSize below ours, so a short page alone does not end the list.
+    """
+    if total is not None:
+        return skip < total
+    return count >= page_size
+
+
+class ManagerClient:
+    """
+    Small Manager.io API client built around one shared requests.Session.
+
+    - Keeps TCP/TLS connections alive in a pool sized for the parallel
+      detail lookups, instead of opening a new connection per call.
+    - Sets the API headers once on the session.
+    - Retries connection errors, timeouts and HTTP 429/5xx responses with
+      jittered exponential backoff (honouring a numeric Retry-After).
+    - Applies per-endpoint timeouts from config.API_ENDPOINT_TIMEOUTS.
+    - Walks list endpoints page by page with skip/pageSize, optionally
+      fetching the next page while the current one is being consumed.
+    """
+
+    RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+    def __init__(
+        self,
+        base_url: str,
+        headers: dict,
+        default_timeout: float,
+        endpoint_timeouts: dict = None,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+        pool_size: int = 16,
+        page_size: int = 1000,
+        prefetch_next_page: bool = True,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.default_timeout = default_timeout
+        self.endpoint_timeouts = dict(endpoint_timeouts or {})
+        self.max_retries = max(0, max_retries)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.page_size = max(1, page_size)
+        self.prefetch_next_page = prefetch_next_page
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers.update(headers)
+
+    def timeout_for(self, endpoint: str) -> float:
+        # "special-account-form/<key>" -> "special-account-form"
+        name = endpoint.split("/", 1)[0]
+        return self.endpoint_timeouts.get(name, self.default_timeout)
+
+    def _backoff_delay(self, attempt: int, response=None) -> float:
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.strip().isdigit():
+                return min(float(retry_after), self.backoff_max)
+        ceiling = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, ceiling)
+
+    def get(self, endpoint: str, params: dict = None, headers: dict = None, stream: bool = False):
+        """
+        GET {base_url}/{endpoint}, retrying transient failures.
+
+        Returns the last response (which may still be a 429/5xx once retries
+        are exhausted) and re-raises the last requests exception if every
+        attempt failed at the connection level.
+        """
+        url = f"{self.base_url}/{endpoint}"
+        timeout = self.timeout_for(endpoint)
+        for attempt in range(self.max_retries + 1):
+            try:
+                response = self.session.get(
+                    url, params=params, headers=headers, timeout=timeout, stream=stream
+                )
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+                print(f"[AIOSOL] {endpoint} attempt {attempt + 1} failed ({exc}); retrying in {delay:.2f}s")
+                time.sleep(delay)
+                continue
+
+            if response.status_code in self.RETRY_STATUS_CODES and attempt < self.max_retries:
+                delay = self._backoff_delay(attempt, response)
+                print(f"[AIOSOL] {endpoint} HTTP {response.status_code}; retrying in {delay:.2f}s")
+                response.close()
+                time.sleep(delay)
+                continue
+            return response
+
+    def get_page(self, endpoint: str, collection_key: str, skip: int, page_size: int):
+        """
+        Fetch one page of a list endpoint. Returns (records, total_records);
+        total_records is None when the response does not report it.
+        """
+        response = self.get(endpoint, params={"skip": skip, "pageSize": page_size})
+        if response.status_code != 200:
+            raise ManagerAPIError(f"{endpoint} HTTP {response.status_code}: {response.text[:500]}")
+        data = response.json()
+        if isinstance(data, list):
+            return data, None
+        elif isinstance(data, dict):
+            return data.get(collection_key, []), data.get("totalRecords")
+        return [], None
+
+    @staticmethod
+    def _stream_page_records(response, collection_key: str, page: dict):
+        """
+        Incrementally parse the records of one page straight from the
+        response body with ijson, without building the full array. Sets
+        page["total"] to the response's totalRecords, if it has one.
+        """
+        chunks = (chunk for chunk in response.iter_content(chunk_size=64 * 1024) if chunk)
+        first_chunk = next(chunks, b"")
+        # Manager.io may answer with a bare list or an object wrapping it.
+        is_bare_list = first_chunk.lstrip()[:1] == b"["
+        item_prefix = "item" if is_bare_list else f"{collection_key}.item"
+        body = _ChunkReader(itertools.chain([first_chunk], chunks))
+        builder = None
+        for prefix, ijson_event, value in ijson.parse(body, use_float=True):
+            if builder is not None:
+                builder.event(ijson_event, value)
+                if prefix == item_prefix and ijson_event in ("end_map", "end_array"):
+                    yield builder.value
+                    builder = None
+            elif prefix == item_prefix:
+                if ijson_event in ("start_map", "start_array"):
+                    builder = ijson.ObjectBuilder()
+                    builder.event(ijson_event, value)
+                else:
+                    yield value
+            elif prefix == "totalRecords" and not is_bare_list:
+                page["total"] = value
+
+    @staticmethod
+    def _record_fingerprint(record) -> bytes:
+        return hashlib.sha1(json.dumps(record, sort_keys=True, default=str).encode("utf-8")).digest()
+
+    def _iter_collection_streamed(self, endpoint: str, collection_key: str, page_size: int, start: int):
+        skip = start
+        previous_page = None  # record fingerprints of the last page
+        while True:
+            page = {"total": None}
+            fingerprints = []
+            # Records that, so far, repeat the previous page one for one; held
+            # back until the page is known not to be a resend of it.
+            pending = []
+            response = self.get(
+                endpoint, params={"skip": skip, "pageSize": page_size}, stream=True
+            )
+            try:
+                if response.status_code != 200:
+                    raise ManagerAPIError(f"{endpoint} HTTP {response.status_code}: {response.text[:500]}")
+                for record in self._stream_page_records(response, collection_key, page):
+                    fingerprint = self._record_fingerprint(record)
+                    index = len(fingerprints)
+                    fingerprints.append(fingerprint)
+                    if (
+                        pending is not None
+                        and previous_page is not None
+                        and index < len(previous_page)
+                        and previous_page[index] == fingerprint
+                    ):
+                        pending.append(record)
+                        continue
+                    if pending:
+                        yield from pending
+                    pending = None
+                    yield record
+            except ijson.JSONError as exc:
+                raise ManagerAPIError(f"{endpoint} returned invalid JSON: {exc}") from exc
+            finally:
+                response.close()
+
+            count = len(fingerprints)
+            total = page["total"]
+            # Without totalRecords, a page identical to the previous one means
+            # the server ignored `skip` and sent it again.
+            if pending and total is None and count == len(previous_page):
+                return
+            if pending:
+                yield from pending
+            skip += count
+            if not count or not _has_more_pages(skip, count, page_size, total):
+                return
+            previous_page = fingerprints
+
+    def iter_collection(
+        self,
+        endpoint: str,
+        collection_key: str,
+        page_size: int = None,
+        prefetch: bool = None,
+        stream: bool = False,
+        start: int = 0,
+    ):
+        """
+        Yield every record of a list endpoint (from offset `start`), one
+        skip/pageSize page at a time, so only the current (and at most one
+        prefetched) page is held in memory. With stream=True and ijson
+        installed, each page is parsed incrementally from the socket instead
+        (no prefetch in that mode). Raises requests.RequestException if any
+        page fails.
+        """
+        page_size = page_size or self.page_size
+        if stream and ijson is not None:
+            yield from self._iter_collection_streamed(endpoint, collection_key, page_size, start)
+            return
+
+        prefetch = self.prefetch_next_page if prefetch is None else prefetch
+
+        def fetch(skip):
+            return self.get_page(endpoint, collection_key, skip, page_size)
+
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ims-page") if prefetch else None
+        try:
+            skip = start
+            next_page = pool.submit(fetch, skip) if pool else None
+            previous_records = None
+            while True:
+                records, total = next_page.result() if pool else fetch(skip)
+                if not records:
+                    break
+                # Without totalRecords, a page identical to the previous one
+                # means the server ignored `skip` and sent it again.
+                if total is None:
+                    if records == previous_records:
+                        break
+                    previous_records = records
+                skip += len(records)
+                has_more = _has_more_pages(skip, len(records), page_size, total)
+                if has_more and pool:
+                    next_page = pool.submit(fetch, skip)
+                yield from records
+                if not has_more:
+                    break
+        finally:
+            if pool:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+    def get_collection(self, endpoint: str, collection_key: str) -> list:
+        """
+        Fetch all records of a list endpoint such as payment-lines. Accepts
+        either a bare JSON list or an object wrapping the list under
+        `collection_key`. Errors are logged and yield an empty list rather
+        than a silently truncated one.
+        """
+        try:
+            return list(self.iter_collection(endpoint, collection_key))
+        except (requests.RequestException, ValueError) as exc:
+            print(f"[AIOSOL] Error fetching {endpoint}: {exc}")
+        return []
+
+
+manager_client = ManagerClient(
+    API_BASE_URL,
+    headers=_api_headers(),
+    default_timeout=API_TIMEOUT_SECONDS,
+    endpoint_timeouts=API_ENDPOINT_TIMEOUTS,
+    max_retries=API_MAX_RETRIES,
+    backoff_base=API_BACKOFF_BASE_SECONDS,
+    backoff_max=API_BACKOFF_MAX_SECONDS,
+    pool_size=max(API_POOL_SIZE, DETAIL_FETCH_CONCURRENCY),
+    page_size=API_PAGE_SIZE,
+    prefetch_next_page=API_PREFETCH_NEXT_PAGE,
+)
+
+
+def fetch_special_accounts():
+    return manager_client.get_collection("special-accounts", "specialAccounts")
 
 def fetch_investor_details(key):
-    url = f"{API_BASE_URL}/special-account-form/{key}"
     try:
-        response = requests.get(url, headers=_api_headers(include_accept_json=False), timeout=API_TIMEOUT_SECONDS)
+        # The form endpoint is called without the JSON Accept header.
+        response = manager_client.get(f"special-account-form/{key}", headers={"Accept": "*/*"})
         if response.status_code == 200:
             data = response.json()
             cf = data.get("CustomFields2") or data.get("CustomFields") or {}
@@ -124,15 +658,16 @@ def fetch_investor_details(key):
 
             # Debug: log a few samples so we can verify field IDs
             global DETAIL_DEBUG_COUNT
-            if DETAIL_DEBUG_COUNT < 5:
-                DETAIL_DEBUG_COUNT += 1
-                try:
-                    print(
-                        f"[DETAIL] key={key}, dates_keys={list(dates.keys())}, "
-                        f"decimals_keys={list(decimals.keys())}"
-                    )
-                except Exception:
-                    pass
+            with DETAIL_DEBUG_LOCK:
+                if DETAIL_DEBUG_COUNT < 5:
+                    DETAIL_DEBUG_COUNT += 1
+                    try:
+                        print(
+                            f"[DETAIL] key={key}, dates_keys={list(dates.keys())}, "
+                            f"decimals_keys={list(decimals.keys())}"
+                        )
+                    except Exception:
+                        pass
 
             raw_start = dates.get(NEW_START_ID) or dates.get(OLD_START_ID, "")
             raw_end = dates.get(NEW_END_ID) or dates.get(OLD_END_ID, "")
@@ -155,82 +690,120 @@ def fetch_investor_details(key):
         print(f"[AIOSOL] Error fetching investor details for key={key}: {exc}")
     return {"start_date": "", "end_date": "", "profit_percentage": 0}
 
-def fetch_payment_lines():
-    """
-    Fetch dividend paid amounts from the payment-lines API.
-    Returns a list of payment line records.
-    """
-    url = f"{API_BASE_URL}/payment-lines"
-    try:
-        response = requests.get(
-            url,
-            headers=_api_headers(),
-            params={"pageSize": 9999},
-            timeout=API_TIMEOUT_SECONDS,
-        )
-        if response.status_code == 200:
-            data = response.json()
-            if isinstance(data, list):
-                return data
-            elif isinstance(data, dict):
-                return data.get("paymentLines", [])
-        else:
-            print(f"[AIOSOL] payment-lines HTTP {response.status_code}: {response.text[:500]}")
-    except requests.RequestException as exc:
-        print(f"[AIOSOL] Error fetching payment lines: {exc}")
-    return []
+# Ledger line collections: (LedgerLine.source, endpoint, collection key)
+LEDGER_LINE_SOURCES = (
+    ("receipt", "receipt-lines", "receiptLines"),
+    ("payment", "payment-lines", "paymentLines"),
+    ("journal", "journal-entry-lines", "journalEntryLines"),
+)
+
 
+def line_fingerprint(line) -> str:
+    """Stable fingerprint of an API line, used as a delta-sync watermark."""
+    return hashlib.sha1(json.dumps(line, sort_keys=True, default=str).encode("utf-8")).hexdigest()
 
-def fetch_receipt_lines():
+
+class LedgerLineFeed:
     """
-    Fetch investment receipts from the receipt-lines API.
-    Returns a list of receipt line records.
+    The lines of one ledger endpoint for a sync, resuming after a stored
+    watermark when possible.
+
+    Given resume_from=(position, last_key), the feed re-reads the record at
+    position - 1 and, if its fingerprint still matches last_key, yields only
+    the records after it. Otherwise (or without a watermark) it yields the
+    whole collection and sets `full`. Once consumed, `position`, `last_key`
+    and `last_date` describe the new watermark.
+
+    Unless streaming, lines are fetched eagerly by the constructor so feeds
+    can be built in parallel; a streamed feed is single-use.
     """
-    url = f"{API_BASE_URL}/receipt-lines"
-    try:
-        response = requests.get(
-            url,
-            headers=_api_headers(),
-            params={"pageSize": 9999},
-            timeout=API_TIMEOUT_SECONDS,
+
+    def __init__(self, source: str, endpoint: str, collection_key: str, resume_from=None, stream: bool = False):
+        self.source = source
+        self.endpoint = endpoint
+        self.collection_key = collection_key
+        self.stream = stream
+        self.full = resume_from is None
+        self.position, self.last_key = resume_from or (0, None)
+        self.last_date = None
+        self.new_count = 0
+        self._lines = None if stream else list(self._iter_lines())
+
+    def __iter__(self):
+        if self._lines is not None:
+            return iter(self._lines)
+        return self._iter_lines()
+
+    def _iter_lines(self):
+        if not self.full:
+            records = manager_client.iter_collection(
+                self.endpoint, self.collection_key, stream=self.stream, start=self.position - 1
+            )
+            first = next(records, None)
+            if first is not None and line_fingerprint(first) == self.last_key:
+                yield from self._track(records)
+                return
+            records.close()
+            print(f"[SYNC] {self.endpoint} changed before the watermark; falling back to a full download.")
+            self.full = True
+            self.position, self.last_key = 0, None
+        yield from self._track(
+            manager_client.iter_collection(self.endpoint, self.collection_key, stream=self.stream)
         )
-        if response.status_code == 200:
-            data = response.json()
-            if isinstance(data, list):
-                return data
-            elif isinstance(data, dict):
-                return data.get("receiptLines", [])
-        else:
-            print(f"[AIOSOL] receipt-lines HTTP {response.status_code}: {response.text[:500]}")
-    except requests.RequestException as exc:
-        print(f"[AIOSOL] Error fetching receipt lines: {exc}")
-    return []
 
+    def _track(self, records):
+        last_record = None
+        for record in records:
+            self.position += 1
+            self.new_count += 1
+            last_record = record
+            if isinstance(record, dict):
+                date_str = str(record.get("date") or "")[:10]
+                if date_str and (not self.last_date or date_str > self.last_date):
+                    self.last_date = date_str
+            yield record
+        if last_record is not None:
+            self.last_key = line_fingerprint(last_record)
+
+
+def fetch_investor_details_bulk(keys, max_workers=None):
+    """
+    Fetch special-account-form details for many account keys in parallel.
 
-def fetch_journal_entry_lines():
+    Keys are de-duplicated and fetched on a bounded thread pool (at most
+    DETAIL_FETCH_CONCURRENCY requests in flight). A failure for one key
+    only affects that key, which falls back to empty terms. The result
+    dict is filled in the order of `keys`, so merging it back into the
+    sync does not depend on which request finished first.
     """
-    Fetch journal entry lines (used for adjustments that hit Loans payable
-    or Profit payable directly, outside of receipts/payments).
+    unique_keys = list(dict.fromkeys(k for k in keys if k))
+    if not unique_keys:
+        return {}
+
+    workers = max(1, min(max_workers or DETAIL_FETCH_CONCURRENCY, len(unique_keys)))
+    details_by_key = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="ims-detail") as pool:
+        futures = {key: pool.submit(fetch_investor_details, key) for key in unique_keys}
+        for key in unique_keys:
+            try:
+                details_by_key[key] = futures[key].result()
+            except Exception as exc:
+                print(f"[AIOSOL] Detail lookup failed for key={key}: {exc}")
+                details_by_key[key] = {"start_date": "", "end_date": "", "profit_percentage": 0}
+    return details_by_key
+
+
+class LedgerCollections(NamedTuple):
     """
-    url = f"{API_BASE_URL}/journal-entry-lines"
-    try:
-        response = requests.get(
-            url,
-            headers=_api_headers(),
-            params={"pageSize": 9999},
-            timeout=API_TIMEOUT_SECONDS,
-        )
-        if response.status_code == 200:
-            data = response.json()
-            if isinstance(data, list):
-                return data
-            elif isinstance(data, dict):
-                return data.get("journalEntryLines", [])
-        else:
-            print(f"[AIOSOL] journal-entry-lines HTTP {response.status_code}: {response.text[:500]}")
-    except requests.RequestException as exc:
-        print(f"[AIOSOL] Error fetching journal entry lines: {exc}")
-    return []
+    The Manager.io collections consumed by the sync (see fetch_ledger_feeds):
+    the special accounts, plus one LedgerLineFeed per line collection
+    (single-use when streaming).
+    """
+    special_accounts: list
+    receipt_lines: LedgerLineFeed
+    payment_lines: LedgerLineFeed
+    journal_entry_lines: LedgerLineFeed
+
 
 # ---------------------------
 # Helper Functions
@@ -266,6 +839,11 @@ def parse_date(date_str):
     except ValueError:
         return None
 
+def iso_date(date_str):
+    """date_str as a zero-padded YYYY-MM-DD when parse_date accepts it, else None."""
+    dt = parse_date(date_str)
+    return dt.strftime("%Y-%m-%d") if dt else None
+
 def calculate_months_difference(start_dt, end_dt):
     if not start_dt or not end_dt:
         return None
@@ -298,6 +876,75 @@ def calculate_monthly_profit(balance, profit_percentage):
     return round((balance * profit_percentage) / 100 / 12, 2)
 
 
+class ProfitAccrual(NamedTuple):
+    duration_months: int
+    remaining_months: int
+    monthly_profit: float
+    profit_payable_up_to_now: float
+
+
+def accrue_profit(balances, profit_percentages, start_dts, end_dts):
+    """
+    Term and profit figures for many investors at once, one ProfitAccrual
+    per investor: the same values as calling calculate_months_difference,
+    calculate_remaining_months, calculate_monthly_profit and
+    calculate_elapsed_months for each one. Uses a single NumPy pass when
+    numpy is installed (PROFIT_ACCRUAL_VECTORIZED), the scalar helpers
+    otherwise.
+    """
+    numeric = all(type(v) in (int, float) for v in itertools.chain(balances, profit_percentages))
+    if np is None or not PROFIT_ACCRUAL_VECTORIZED or not numeric or not balances:
+        accruals = []
+        for balance, profit_percentage, start_dt, end_dt in zip(balances, profit_percentages, start_dts, end_dts):
+            monthly_profit = calculate_monthly_profit(balance, profit_percentage)
+            accruals.append(ProfitAccrual(
+                calculate_months_difference(start_dt, end_dt),
+                calculate_remaining_months(end_dt),
+                monthly_profit,
+                calculate_elapsed_months(start_dt) * (monthly_profit or 0),
+            ))
+        return accruals
+
+    today = datetime.today()
+    today_month = today.year * 12 + today.month
+    has_start = np.array([dt is not None for dt in start_dts])
+    has_end = np.array([dt is not None for dt in end_dts])
+    start_month = np.array([dt.year * 12 + dt.month if dt else 0 for dt in start_dts], dtype=np.int64)
+    end_month = np.array([dt.year * 12 + dt.month if dt else 0 for dt in end_dts], dtype=np.int64)
+
+    duration = end_month - start_month
+    remaining = np.where(has_end, np.maximum(0, end_month - today_month), 0)
+    elapsed = np.where(has_start, np.maximum(0, today_month - start_month), 0)
+
+    # round(x, 2) rounds the exact binary value half-to-even; rint(x * 100)
+    # agrees except where x * 100 lands (within float error) on a .5, so
+    # those few values go through round() itself.
+    percentage = np.asarray(profit_percentages, dtype=np.float64)
+    unrounded = np.asarray(balances, dtype=np.float64) * percentage / 100 / 12
+    cents = unrounded * 100
+    monthly = np.rint(cents) / 100
+    near_half = np.abs(np.abs(cents - np.floor(cents)) - 0.5) <= 1e-9 * np.maximum(1.0, np.abs(cents))
+    for i in np.flatnonzero(near_half):
+        monthly[i] = round(float(unrounded[i]), 2)
+    monthly = np.where(percentage != 0, monthly, 0.0)
+    payable = elapsed * monthly
+
+    both = has_start & has_end
+    return [
+        ProfitAccrual(d if b else None, r, m, p)
+        for d, b, r, m, p in zip(duration.tolist(), both.tolist(), remaining.tolist(), monthly.tolist(), payable.tolist())
+    ]
+
+
+def accrue_profit_due(payables, paid):
+    """Current payable per investor: profit payable so far minus profit paid, never below zero."""
+    numeric = all(type(v) in (int, float) for v in itertools.chain(payables, paid))
+    if np is None or not PROFIT_ACCRUAL_VECTORIZED or not numeric or not payables:
+        return [max(0, payable - amount) for payable, amount in zip(payables, paid)]
+    due = np.asarray(payables, dtype=np.float64) - np.asarray(paid, dtype=np.float64)
+    return np.maximum(0.0, due).tolist()
+
+
 def extract_investor_terms_from_entry(entry):
     """
     Try to extract start_date, end_date and profit_percentage
@@ -372,64 +1019,10 @@ def split_investor_variant(raw_name: str):
     return base_name, phase_label, display
 
 
-def group_investors_for_dashboard(investors):
-    """
-    Group Investor rows by base investor name (ignoring numeric codes and
-    phase suffixes in parentheses) so the dashboard shows one row per
-    investor, with aggregated balances and dates.
-    """
-    groups = {}
-
-    for inv in investors:
-        base_name, phase_label, display_name = split_investor_variant(inv.name)
-        key = base_name or inv.name or "Unknown"
-
-        g = groups.get(key)
-        if not g:
-            g = groups[key] = {
-                "name": key,
-                "start_date": None,
-                "end_date": None,
-                "duration_months": None,
-                "remaining_months": 0,
-                "profit_percentage": 0.0,
-                "balance": 0.0,
-                "monthly_profit": 0.0,
-            }
-
-        # Aggregate numeric fields
-        g["balance"] += inv.balance or 0.0
-        g["monthly_profit"] += inv.monthly_profit or 0.0
-
-        # Track earliest start date and latest end date
-        if inv.start_date:
-            if not g["start_date"] or inv.start_date < g["start_date"]:
-                g["start_date"] = inv.start_date
-        if inv.end_date:
-            if not g["end_date"] or inv.end_date > g["end_date"]:
-                g["end_date"] = inv.end_date
-
-        # For profit percentage, prefer non-zero values; if multiple
-        # different values exist we leave the last non-zero value.
-        if inv.profit_percentage:
-            g["profit_percentage"] = inv.profit_percentage
-
-    # Derive duration and remaining months per group using aggregated dates
-    for g in groups.values():
-        start_date = g["start_date"]
-        end_date = g["end_date"]
-
-        if start_date and end_date:
-            start_dt = parse_date(start_date)
-            end_dt = parse_date(end_date)
-            g["duration_months"] = calculate_months_difference(start_dt, end_dt)
-            g["remaining_months"] = calculate_remaining_months(end_dt)
-        else:
-            g["duration_months"] = None
-            g["remaining_months"] = 0
-
-    # Sort groups by investor name for stable display
-    return sorted(groups.values(), key=lambda x: x["name"])
+def investor_group_key(raw_name: str) -> str:
+    """Dashboard group for an investor account name (its base name)."""
+    base_name, _, _ = split_investor_variant(raw_name)
+    return base_name or raw_name or "Unknown"
 
 
 def _parse_investor_name_from_account(account_str: str, expected_prefix: str):
@@ -454,26 +1047,111 @@ def _parse_investor_name_from_account(account_str: str, expected_prefix: str):
     return None
 
 
-def _parse_investor_name_from_account_v2(account_str: str, expected_prefix: str):
+# Investor ledger accounts, in the order their prefixes are matched.
+LEDGER_ACCOUNT_PREFIXES = (
+    ("loans", "Loans payable"),
+    ("profit", "Profit payable"),
+    ("dividend", "Dividend payable"),
+)
+
+# One pass over an account string: which prefix it starts with
+# (case-insensitive), then the investor name after any spaces and
+# dashes (-, –, —) that separate it from the prefix.
+LEDGER_ACCOUNT_PATTERN = re.compile(
+    "^(?:"
+    + "|".join(f"(?P<{kind}>{re.escape(prefix)})" for kind, prefix in LEDGER_ACCOUNT_PREFIXES)
+    + r")[ \-\u2013\u2014]*\s*(?P<name>.*?)\s*\Z",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+class LedgerAccountClass(NamedTuple):
+    kind: str  # loans / profit / dividend
+    investor_name: str
+    base_name: str
+    phase_label: str
+    display_name: str
+
+
+@lru_cache(maxsize=LEDGER_CLASSIFIER_CACHE_SIZE)
+def classify_ledger_account(account_str: str):
     """
-    More robust parsing of investor name from an account string such as
-    'Loans payable - Name' or 'Profit payable — Name' by:
-      - matching the expected prefix case-insensitively
-      - stripping the prefix
-      - trimming any dash/space separator immediately after
+    Classify an account string such as 'Loans payable - Name (P2)' as a
+    LedgerAccountClass, or None when it is not an investor's Loans /
+    Profit / Dividend payable account. Memoised: the same few hundred
+    account names repeat across every ledger line.
     """
-    if not account_str:
+    match = LEDGER_ACCOUNT_PATTERN.match(account_str.strip())
+    if not match or not match.group("name"):
+        return None
+    kind = next(kind for kind, _ in LEDGER_ACCOUNT_PREFIXES if match.group(kind))
+    investor_name = match.group("name")
+    return LedgerAccountClass(kind, investor_name, *split_investor_variant(investor_name))
+
+
+def ledger_line_row(source: str, line):
+    """
+    Map a receipt/payment/journal line from the API to a LedgerLine row
+    (as a dict), or return None when the line does not hit an investor's
+    Loans payable / Profit payable / Dividend payable account.
+    """
+    if not isinstance(line, dict):
         return None
-    raw = account_str.strip()
-    prefix = expected_prefix.strip()
-    if not raw.lower().startswith(prefix.lower()):
+    account = classify_ledger_account(line.get("account") or "")
+    if account is None:
         return None
 
-    # Remove the prefix and any separators right after it (spaces and dashes)
-    rest = raw[len(prefix) :]
-    rest = rest.lstrip(" -–—\u2013\u2014")
-    name = rest.strip()
-    return name or None
+    amount = debit_val = credit_val = 0
+    if source == "journal":
+        debit = line.get("debit") or {}
+        credit = line.get("credit") or {}
+        debit_val = abs(debit.get("value", 0)) if isinstance(debit, dict) else 0
+        credit_val = abs(credit.get("value", 0)) if isinstance(credit, dict) else 0
+    else:
+        amount = abs(line.get("amount", {}).get("value", 0))
+
+    date_str = str(line.get("date") or "").split("T")[0].strip()
+    return {
+        "source": source,
+        "account_kind": account.kind,
+        "investor_name": account.investor_name,
+        "base_name": account.base_name,
+        "phase_label": account.phase_label,
+        "display_name": account.display_name,
+        "date": iso_date(date_str),
+        "amount": amount,
+        "debit": debit_val,
+        "credit": credit_val,
+    }
+
+
+def ledger_account_rows(accounts_data):
+    """
+    LedgerAccount rows (as dicts) for every named Loans payable / Profit
+    payable special account with a non-zero balance. Loans payable rows
+    come first so row ids reflect the order groups are seeded in.
+    """
+    rows = []
+    for control_account in ("loans payable", "profit payable"):
+        for entry in accounts_data:
+            control = (entry.get("controlAccount") or "").strip()
+            if control.lower() != control_account:
+                continue
+            name = entry.get("name", "")
+            balance = extract_balance_amount(entry)
+            if not name or balance == 0:
+                continue
+            base_name, phase_label, display_name = split_investor_variant(name)
+            rows.append({
+                "control_account": control,
+                "name": name,
+                "base_name": base_name,
+                "phase_label": phase_label,
+                "display_name": display_name,
+                "balance": balance,
+            })
+    return rows
+
 
 def format_currency(value):
     try:
@@ -481,201 +1159,1503 @@ def format_currency(value):
     except (ValueError, TypeError):
         return "0.00"
 
+def read_session():
+    """
+    Session for request handlers that only read. Under the tuned SQLite
+    profile this comes from the query-only connection pool and is closed
+    when the app context ends; otherwise it is db.session.
+    """
+    if ReadSession is None:
+        return db.session
+    if "read_session" not in g:
+        g.read_session = ReadSession()
+    return g.read_session
+
+
+@app.teardown_appcontext
+def close_read_session(exc):
+    read = g.pop("read_session", None)
+    if read is not None:
+        read.close()
+
+
+def current_generation():
+    """
+    (generation, published_at) of the published sync data,
+    or (0, None) before the first sync.
+    """
+    state = db.session.get(SyncState, SYNC_STATE_ID)
+    if state is None:
+        return 0, None
+    return state.generation, state.published_at
+
 # ---------------------------
 # Main Update Logic
 # ---------------------------
-def update_database(force: bool = False):
+def fetch_ledger_feeds(resume_from: dict = None, stream: bool = None) -> LedgerCollections:
     """
-    Pull fresh data from Manager.io APIs and refresh the Investor table.
-    Runs at most once every UPDATE_INTERVAL_SECONDS unless force=True.
-    Wrapped in a process-wide lock to avoid concurrent SQLite writes.
+    Fetch the ledger collections for a sync: the special accounts plus the
+    line collections as LedgerLineFeeds resuming from `resume_from`
+    ({source: (position, last_key)}), fetched in parallel unless streaming.
+    Raises requests.RequestException if a line collection cannot be read.
     """
-    global last_update_time
+    if stream is None:
+        stream = API_STREAM_LEDGER_LINES
+    resume_from = resume_from or {}
 
-    with db_update_lock:
-        if not force and last_update_time is not None:
-            elapsed = (datetime.utcnow() - last_update_time).total_seconds()
-            if elapsed < UPDATE_INTERVAL_SECONDS:
-                return
+    def build_feed(source, endpoint, collection_key):
+        return LedgerLineFeed(source, endpoint, collection_key, resume_from.get(source), stream)
 
-        accounts_data = fetch_special_accounts()
-        payment_lines = fetch_payment_lines()
-        journal_lines = fetch_journal_entry_lines()
+    with ThreadPoolExecutor(max_workers=1 + len(LEDGER_LINE_SOURCES), thread_name_prefix="ims-ledger") as pool:
+        accounts = pool.submit(fetch_special_accounts)
+        feeds = [pool.submit(build_feed, *spec) for spec in LEDGER_LINE_SOURCES]
+        return LedgerCollections(accounts.result(), *(feed.result() for feed in feeds))
 
-        # If the API call failed or returned nothing, don't wipe existing data
-        if not accounts_data:
-            print("[SYNC] No special-accounts data received; skipping DB refresh.")
-            return
 
-        total_accounts = len(accounts_data)
-        print(f"[SYNC] Received {total_accounts} special-accounts records.")
+def ledger_resume_points(full_resync: bool = False) -> dict:
+    """
+    Watermarks to resume each line collection from, as
+    {source: (position, last_key)}. Collections missing here get a full
+    download: when delta sync is off, a full resync was requested, or the
+    last full download is older than FULL_RESYNC_INTERVAL_SECONDS.
+    """
+    if not DELTA_SYNC_ENABLED or full_resync:
+        return {}
+    now = datetime.utcnow()
+    resume_from = {}
+    for mark in SyncWatermark.query.all():
+        if not mark.position or not mark.last_key or not mark.full_synced_at:
+            continue
+        if (now - mark.full_synced_at).total_seconds() >= FULL_RESYNC_INTERVAL_SECONDS:
+            continue
+        resume_from[mark.source] = (mark.position, mark.last_key)
+    return resume_from
+
 
-        db.session.query(Investor).delete()  # Clear old records
+class LedgerAggregates:
+    """
+    The one place ledger lines are summed. A single grouped query over the
+    local ledger store yields, per investor account (investor name, with its
+    base name / phase / display name), the accumulators every consumer
+    needs; the sync and the summary views read their figures from it:
+
+    - receipts and journal credits to Loans payable are principal received
+    - payments and journal debits to Loans payable are principal repaid
+    - payments and journal debits to Profit/Dividend payable are profit paid
+    - journal credits minus debits to Profit payable are the profit payable
+      movement (used when there are no Profit payable special accounts)
+
+    Receipts to Profit/Dividend payable and journal lines to them without
+    a debit are not "active": on their own they do not make an
+    investor/phase appear in the summary.
+    """
 
-        # Gather "Profit payable" amounts by investor name from special accounts
-        profit_payable_data = {}
-        profit_payable_count = 0
-        for entry in accounts_data:
-            control = (entry.get("controlAccount") or "").strip().lower()
-            if control == "profit payable":
-                name = entry.get("name", "")
-                payable_value = extract_balance_amount(entry)
-                profit_payable_data[name] = payable_value
-                profit_payable_count += 1
-
-        # Aggregate profit paid amounts from payment-lines API.
-        # We treat lines posted to either "Dividend payable — Name"
-        # or "Profit payable — Name" as profit distributions.
-        dividend_paid_data = {}
-        for line in payment_lines:
-            if not isinstance(line, dict):
-                continue
-            account_str = (line.get("account") or "").strip()
-            investor_name = (
-                _parse_investor_name_from_account_v2(account_str, "Dividend payable")
-                or _parse_investor_name_from_account_v2(account_str, "Profit payable")
+    def __init__(self, session):
+        self.session = session
+        is_receipt_loans = and_(LedgerLine.source == "receipt", LedgerLine.account_kind == "loans")
+        is_payment = LedgerLine.source == "payment"
+        is_journal = LedgerLine.source == "journal"
+        is_loans = LedgerLine.account_kind == "loans"
+        is_active = case(
+            (and_(LedgerLine.source == "receipt", ~is_loans), 0),
+            (and_(is_journal, ~is_loans, LedgerLine.debit == 0), 0),
+            else_=1,
+        )
+        self.rows = (
+            session.query(
+                LedgerLine.investor_name,
+                LedgerLine.base_name,
+                LedgerLine.phase_label,
+                LedgerLine.display_name,
+                func.max(is_active).label("active"),
+                func.min(case((is_active == 1, LedgerLine.id))).label("first_id"),
+                func.min(LedgerLine.id).label("first_any_id"),
+                func.sum(case(
+                    (is_receipt_loans, LedgerLine.amount),
+                    (and_(is_journal, is_loans), LedgerLine.credit),
+                    else_=0,
+                )).label("total_received"),
+                func.sum(case(
+                    (and_(is_payment, is_loans), LedgerLine.amount),
+                    (and_(is_journal, is_loans), LedgerLine.debit),
+                    else_=0,
+                )).label("principal_repaid"),
+                func.sum(case(
+                    (and_(is_payment, ~is_loans), LedgerLine.amount),
+                    (and_(is_journal, ~is_loans), LedgerLine.debit),
+                    else_=0,
+                )).label("profit_paid"),
+                func.sum(case(
+                    (and_(is_journal, LedgerLine.account_kind == "profit"), LedgerLine.credit - LedgerLine.debit),
+                    else_=0,
+                )).label("journal_profit_net"),
+                func.min(case((is_receipt_loans, LedgerLine.date))).label("first_receipt_date"),
+                func.max(case((is_receipt_loans, LedgerLine.date))).label("last_receipt_date"),
             )
-            if investor_name:
-                amount = abs(line.get("amount", {}).get("value", 0))
-                dividend_paid_data[investor_name] = dividend_paid_data.get(investor_name, 0) + amount
-
-        # Journal-entry-lines: debits to Profit/Dividend payable reduce the liability
-        # and should be treated as profit distributions.
-        for line in journal_lines:
-            if not isinstance(line, dict):
-                continue
-            account_str = (line.get("account") or "").strip()
-            investor_name = (
-                _parse_investor_name_from_account_v2(account_str, "Profit payable")
-                or _parse_investor_name_from_account_v2(account_str, "Dividend payable")
+            .group_by(
+                LedgerLine.investor_name,
+                LedgerLine.base_name,
+                LedgerLine.phase_label,
+                LedgerLine.display_name,
             )
-            if not investor_name:
-                continue
-            debit = line.get("debit") or {}
-            amount = abs(debit.get("value", 0)) if isinstance(debit, dict) else 0
-            if amount:
-                dividend_paid_data[investor_name] = dividend_paid_data.get(investor_name, 0) + amount
+            .all()
+        )
 
-        # Process investor "Loans payable" accounts
-        loans_payable_count = 0
-        for entry in accounts_data:
-            if entry.get("controlAccount") != "Loans payable":
+    def profit_paid_by_investor(self) -> dict:
+        """Profit distributions per investor account name (Investor.name)."""
+        paid = {}
+        for row in self.rows:
+            paid[row.investor_name] = paid.get(row.investor_name, 0) + (row.profit_paid or 0)
+        return paid
+
+    def by_phase(self) -> dict:
+        """
+        The accumulators per (base_name, phase_label, display_name), in that
+        order, skipping lines whose investor name has no base name.
+        """
+        phases = {}
+        for row in self.rows:
+            if not row.base_name:
                 continue
-
-            name = entry.get("name", "")
-            balance = extract_balance_amount(entry)
-            # Skip investors whose current balance is zero
-            if not balance:
+            key = (row.base_name, row.phase_label, row.display_name)
+            acc = phases.get(key)
+            if acc is None:
+                phases[key] = dict(row._mapping)
                 continue
-            loans_payable_count += 1
-
-            # First, try to get Start/End/Profit from the special-accounts entry itself.
-            terms_from_entry = extract_investor_terms_from_entry(entry)
-
-            start_date = terms_from_entry["start_date"]
-            end_date = terms_from_entry["end_date"]
-            profit_percentage = terms_from_entry["profit_percentage"]
-
-            # If any of the key fields are missing, fall back to the
-            # more detailed special-account-form/{key} endpoint.
-            if not start_date or not end_date or not profit_percentage:
-                key = entry.get("key", "") or entry.get("Key", "")
-                if key:
-                    details = fetch_investor_details(key)
-                    start_date = start_date or details.get("start_date", "")
-                    end_date = end_date or details.get("end_date", "")
-                    profit_percentage = profit_percentage or details.get("profit_percentage", 0)
-
-            start_date, end_date = ensure_correct_dates(start_date, end_date)
-            start_dt = parse_date(start_date)
-            end_dt = parse_date(end_date)
-
-            duration_months = calculate_months_difference(start_dt, end_dt)
-            remaining_months = calculate_remaining_months(end_dt)
-            monthly_profit = calculate_monthly_profit(balance, profit_percentage or 0)
-
-            elapsed_months = calculate_elapsed_months(start_dt)
-            total_profit_payable = elapsed_months * (monthly_profit or 0)
-
-            # Get dividend paid from payment-lines aggregation
-            dividend_paid_value = dividend_paid_data.get(name, 0)
-            # For backward compatibility, also assign profit_paid from special accounts if needed
-            profit_paid_value = profit_payable_data.get(name, 0)
-            # Current Payable = total profit payable minus dividend paid
-            current_payable = max(0, total_profit_payable - dividend_paid_value)
-
-            investor = Investor(
-                name=name,
-                start_date=start_date,
-                end_date=end_date,
-                duration_months=duration_months,
-                remaining_months=remaining_months,
-                profit_percentage=profit_percentage,
-                balance=balance,
-                monthly_profit=monthly_profit,
-                profit_payable_up_to_now=total_profit_payable,
-                profit_paid=profit_paid_value,
-                profit_due=current_payable,
-                dividend_paid=dividend_paid_value
+            acc["active"] = max(acc["active"], row.active)
+            if row.first_id is not None:
+                acc["first_id"] = row.first_id if acc["first_id"] is None else min(acc["first_id"], row.first_id)
+            acc["first_any_id"] = min(acc["first_any_id"], row.first_any_id)
+            for field in ("total_received", "principal_repaid", "profit_paid", "journal_profit_net"):
+                acc[field] = (acc[field] or 0) + (row._mapping[field] or 0)
+            if row.first_receipt_date:
+                if not acc["first_receipt_date"] or row.first_receipt_date < acc["first_receipt_date"]:
+                    acc["first_receipt_date"] = row.first_receipt_date
+                if not acc["last_receipt_date"] or row.last_receipt_date > acc["last_receipt_date"]:
+                    acc["last_receipt_date"] = row.last_receipt_date
+        return dict(sorted(phases.items()))
+
+    def account_balances(self):
+        """
+        Current Loans payable / Profit payable special-account balances per
+        (base_name, phase_label, display_name), and the number of Profit
+        payable special accounts.
+        """
+        rows = (
+            self.session.query(
+                LedgerAccount.base_name,
+                LedgerAccount.phase_label,
+                LedgerAccount.display_name,
+                func.lower(LedgerAccount.control_account).label("control"),
+                func.sum(LedgerAccount.balance).label("balance"),
+                func.min(LedgerAccount.id).label("first_id"),
+            )
+            .filter(LedgerAccount.base_name != "")
+            .group_by(
+                LedgerAccount.base_name,
+                LedgerAccount.phase_label,
+                LedgerAccount.display_name,
+                func.lower(LedgerAccount.control_account),
             )
-            db.session.add(investor)
+            .all()
+        )
+        profit_special_count = self.session.query(func.count(LedgerAccount.id)).filter(
+            func.lower(LedgerAccount.control_account) == "profit payable"
+        ).scalar()
+        return rows, profit_special_count
+
+
+def _new_summary_entry(name: str, phase_label: str = None) -> dict:
+    entry = {
+        "name": name,
+        "current_balance_loans": 0.0,
+        "current_balance_profit": 0.0,
+        "total_received": 0.0,
+        "principal_repaid": 0.0,
+        "profit_paid": 0.0,
+        "first_receipt_date": None,
+        "last_receipt_date": None,
+    }
+    if phase_label is not None:
+        entry["phase"] = phase_label
+    return entry
 
-        db.session.commit()
-        print(f"[SYNC] Profit Payable entries: {profit_payable_count}, Loans payable entries: {loans_payable_count}")
-        last_update_time = datetime.utcnow()
 
-@app.before_request
-def before_request():
-    # Skip automatic sync for the explicit /sync endpoint
-    if request.endpoint == 'sync':
-        return
+def build_investment_summary_groups(ledger: LedgerAggregates):
+    """
+    Build the grouped investment summary (one entry per investor base name,
+    each with its per-phase entries) from the ledger aggregates. Groups are
+    ordered by Loans payable balance (largest first), ties in first-seen
+    order. The sync materializes the result (write_summary_tables).
+    """
+    groups = {}
+    first_seen = {}
 
-    # Only auto-sync once when there is no data yet.
-    global last_update_time
-    if last_update_time is None and Investor.query.count() == 0:
-        update_database(force=True)
+    def ensure_group_and_phase(base_name, phase_label, display_name, seen):
+        group = groups.get(base_name)
+        if not group:
+            group = groups[base_name] = _new_summary_entry(base_name)
+            group["phases"] = {}
+            first_seen[base_name] = seen
+        else:
+            first_seen[base_name] = min(first_seen[base_name], seen)
+        phase = group["phases"].get(display_name)
+        if not phase:
+            phase = group["phases"][display_name] = _new_summary_entry(display_name, phase_label)
+        return group, phase
 
-    # --- Authentication guard ---
-    # Allow unauthenticated access to the login page, health check and static assets.
-    open_endpoints = {'login', 'healthcheck'}
-    endpoint = request.endpoint or ''
-    if endpoint in open_endpoints or endpoint.startswith('static'):
-        return
+    # Seed current Loans payable / Profit payable balances per investor/phase
+    account_rows, profit_special_count = ledger.account_balances()
+    for row in account_rows:
+        group, phase = ensure_group_and_phase(row.base_name, row.phase_label, row.display_name, (0, row.first_id))
+        field = "current_balance_loans" if row.control == "loans payable" else "current_balance_profit"
+        group[field] += row.balance or 0.0
+        phase[field] += row.balance or 0.0
+
+    for (base_name, phase_label, display_name), row in ledger.by_phase().items():
+        # If there are no Profit Payable special accounts, derive balances
+        # from journal-entry-lines (credit increases liability, debit reduces it).
+        profit_delta = row["journal_profit_net"] if profit_special_count == 0 else 0
+        if not row["active"] and not profit_delta:
+            continue
+        seen = (1, row["first_id"] if row["active"] else row["first_any_id"])
+        group, phase = ensure_group_and_phase(base_name, phase_label, display_name, seen)
+        for target in (group, phase):
+            target["total_received"] += row["total_received"] or 0.0
+            target["principal_repaid"] += row["principal_repaid"] or 0.0
+            target["profit_paid"] += row["profit_paid"] or 0.0
+            target["current_balance_profit"] += profit_delta or 0.0
+            if row["first_receipt_date"]:
+                if not target["first_receipt_date"] or row["first_receipt_date"] < target["first_receipt_date"]:
+                    target["first_receipt_date"] = row["first_receipt_date"]
+                if not target["last_receipt_date"] or row["last_receipt_date"] > target["last_receipt_date"]:
+                    target["last_receipt_date"] = row["last_receipt_date"]
 
-    # If neither an environment-based admin password nor a stored
-    # AdminUser exists, do not allow access beyond login.
-    has_db_admin = AdminUser.query.first() is not None
-    if not ADMIN_PASSWORD and not has_db_admin:
-        return redirect(url_for('login'))
+    # Finalize computed balances and match flags
+    group_list = []
+    for group in groups.values():
+        for phase in group["phases"].values():
+            phase["computed_balance"] = phase["total_received"] - phase["principal_repaid"]
 
-    if not session.get('logged_in'):
-        return redirect(url_for('login'))
+        group["computed_balance"] = group["total_received"] - group["principal_repaid"]
+        loans_balance = group.get("current_balance_loans") or 0.0
+        group["balance_match"] = abs(group["computed_balance"] - loans_balance) < 0.01
 
+        group["phases_list"] = sorted(group["phases"].values(), key=lambda p: p["name"])
+        group_list.append(group)
 
-@app.route('/login', methods=['GET', 'POST'])
-def login():
-    if session.get('logged_in'):
-        return redirect(url_for('home'))
+    # Order summary groups by Loans payable current balance (largest to smallest)
+    group_list.sort(key=lambda g: (-(g.get("current_balance_loans") or 0), first_seen[g["name"]]))
+    return group_list
+
+
+SUMMARY_FIELDS = (
+    "current_balance_loans",
+    "current_balance_profit",
+    "total_received",
+    "principal_repaid",
+    "profit_paid",
+    "computed_balance",
+    "first_receipt_date",
+    "last_receipt_date",
+)
 
-    error = None
-    if request.method == 'POST':
-        username = (request.form.get('username') or '').strip()
-        password = request.form.get('password') or ''
 
-        admin_user = AdminUser.query.first()
-        if admin_user:
-            if username == admin_user.username and check_password_hash(admin_user.password_hash, password):
-                session['logged_in'] = True
-                session['admin_username'] = admin_user.username
-                return redirect(url_for('home'))
-            else:
-                error = "Invalid username or password"
-        else:
-            if username == ADMIN_USERNAME and password == ADMIN_PASSWORD:
-                session['logged_in'] = True
-                session['admin_username'] = ADMIN_USERNAME
-                return redirect(url_for('home'))
-            else:
+def write_summary_tables(group_list):
+    """
+    Replace the SummaryGroup / SummaryPhase rows with `group_list` (from
+    build_investment_summary_groups) inside the current transaction,
+    unless they already hold exactly that. Returns (group count, phase
+    count, whether the rows changed).
+    """
+    first_id = (db.session.query(func.max(SummaryGroup.id)).scalar() or 0) + 1
+    group_rows = []
+    phase_rows = []
+    for position, group in enumerate(group_list):
+        group_id = first_id + position
+        group_rows.append({
+            "id": group_id,
+            "position": position,
+            "name": group["name"],
+            "search_name": (group["name"] or "").lower(),
+            "balance_match": group["balance_match"],
+            **{field: group[field] for field in SUMMARY_FIELDS},
+        })
+        for phase_position, phase in enumerate(group["phases_list"]):
+            phase_rows.append({
+                "group_id": group_id,
+                "position": phase_position,
+                "name": phase["name"],
+                "phase_label": phase["phase"],
+                **{field: phase[field] for field in SUMMARY_FIELDS},
+            })
+    if _stored_summary() == _summary_content(group_rows, phase_rows):
+        return len(group_rows), len(phase_rows), False
+
+    db.session.query(SummaryPhase).delete()
+    db.session.query(SummaryGroup).delete()
+    if group_rows:
+        db.session.execute(insert(SummaryGroup), group_rows)
+    if phase_rows:
+        db.session.execute(insert(SummaryPhase), phase_rows)
+    return len(group_rows), len(phase_rows), True
+
+
+SUMMARY_GROUP_COLUMNS = [column.name for column in SummaryGroup.__table__.columns if column.name != "id"]
+SUMMARY_PHASE_COLUMNS = [
+    column.name for column in SummaryPhase.__table__.columns if column.name not in ("id", "group_id")
+]
+
+
+def _summary_content(group_rows, phase_rows):
+    """
+    The summary rows without their ids, for comparison: group values in
+    position order, and phase values keyed by (group position, position).
+    """
+    group_positions = {row["id"]: row["position"] for row in group_rows}
+    return (
+        [tuple(row[column] for column in SUMMARY_GROUP_COLUMNS) for row in group_rows],
+        {
+            (group_positions[row["group_id"]], row["position"]): tuple(row[column] for column in SUMMARY_PHASE_COLUMNS)
+            for row in phase_rows
+        },
+    )
+
+
+def _stored_summary():
+    """_summary_content() of the stored SummaryGroup / SummaryPhase rows."""
+    group_rows = [
+        row._asdict() for row in db.session.execute(
+            select(SummaryGroup.id, *(getattr(SummaryGroup, column) for column in SUMMARY_GROUP_COLUMNS))
+            .order_by(SummaryGroup.position)
+        )
+    ]
+    phase_rows = [
+        row._asdict() for row in db.session.execute(
+            select(SummaryPhase.group_id, *(getattr(SummaryPhase, column) for column in SUMMARY_PHASE_COLUMNS))
+        )
+    ]
+    return _summary_content(group_rows, phase_rows)
+
+
+# Investor columns refreshed by the sync (everything except id / account_key)
+INVESTOR_SYNC_COLUMNS = (
+    "name",
+    "base_name",
+    "start_date",
+    "end_date",
+    "duration_months",
+    "remaining_months",
+    "profit_percentage",
+    "balance",
+    "monthly_profit",
+    "profit_payable_up_to_now",
+    "profit_paid",
+    "profit_due",
+    "dividend_paid",
+)
+
+
+def apply_investor_changes(incoming: dict) -> dict:
+    """
+    Reconcile the Investor table with `incoming` ({account_key: column
+    values}) in bulk: insert new accounts, update only the columns that
+    changed on existing ones and delete accounts that have vanished
+    (including legacy rows without an account_key).
+
+    Returns a change report: counts of inserted, updated, deleted and
+    unchanged rows.
+    """
+    existing = {}
+    legacy_ids = []  # rows from before account keys; always replaced
+    for row in db.session.query(
+        Investor.id,
+        Investor.account_key,
+        *(getattr(Investor, column) for column in INVESTOR_SYNC_COLUMNS),
+    ):
+        if row.account_key is None:
+            legacy_ids.append(row.id)
+        else:
+            existing[row.account_key] = row
+
+    inserts = []
+    updates = []
+    unchanged = 0
+    for account_key, values in incoming.items():
+        current = existing.pop(account_key, None)
+        if current is None:
+            inserts.append({"account_key": account_key, **values})
+            continue
+        changed = {
+            column: values[column]
+            for column in INVESTOR_SYNC_COLUMNS
+            if getattr(current, column) != values[column]
+        }
+        if changed:
+            updates.append({"id": current.id, **changed})
+        else:
+            unchanged += 1
+    deleted_ids = legacy_ids + [row.id for row in existing.values()]
+
+    if deleted_ids:
+        db.session.query(Investor).filter(Investor.id.in_(deleted_ids)).delete(synchronize_session=False)
+    if updates:
+        db.session.execute(update(Investor), updates)
+    if inserts:
+        db.session.execute(insert(Investor), inserts)
+
+    return {
+        "inserted": len(inserts),
+        "updated": len(updates),
+        "deleted": len(deleted_ids),
+        "unchanged": unchanged,
+    }
+
+
+# LedgerLine columns copied from the staging table on publish, and how
+# many staged lines are written per transaction while a sync reads them.
+LEDGER_LINE_COLUMNS = [column.name for column in LedgerLine.__table__.columns if column.name != "id"]
+LEDGER_LINE_BATCH_SIZE = 1000
+
+
+def stage_ledger_lines(rows: list) -> int:
+    """Write one batch of a sync's ledger lines to the staging table."""
+    if rows:
+        db.session.execute(insert(LedgerLineStaging), rows)
+        db.session.commit()
+    return len(rows)
+
+
+class StagedSync(NamedTuple):
+    """A fully built sync generation, ready to be published."""
+    account_rows: list
+    line_feeds: list
+    sync_id: str  # LedgerLineStaging rows of this sync
+    line_count: int
+    investors: dict  # account_key -> Investor column values
+    profit_payable_count: int
+    accrued_on: date  # the day the investor figures were computed for
+
+
+def _no_progress(stage: str, **details):
+    pass
+
+
+def stage_sync(full_resync: bool = False, progress=_no_progress):
+    """
+    Build the next sync generation from Manager.io. Every API call and all
+    per-account computation happen here, before anything is written, so the
+    published tables are never held open while the sync waits on the
+    network. Returns a StagedSync, or None when the data could not be read.
+
+    progress(stage, **details) is called as the sync moves along.
+    """
+    progress("fetching")
+    try:
+        accounts_data, *line_feeds = fetch_ledger_feeds(ledger_resume_points(full_resync))
+    except requests.RequestException as exc:
+        print(f"[SYNC] Error fetching ledger lines ({exc}); skipping DB refresh.")
+        return None
+
+    # If the API call failed or returned nothing, don't wipe existing data
+    if not accounts_data:
+        print("[SYNC] No special-accounts data received; skipping DB refresh.")
+        return None
+
+    total_accounts = len(accounts_data)
+    print(f"[SYNC] Received {total_accounts} special-accounts records.")
+
+    # Collect investor "Loans payable" accounts first, taking
+    # Start/End/Profit from the special-accounts entry itself where
+    # possible, and note which keys still need a detail lookup.
+    loan_accounts = []
+    detail_keys = []
+    for entry in accounts_data:
+        if entry.get("controlAccount") != "Loans payable":
+            continue
+
+        balance = extract_balance_amount(entry)
+        # Skip investors whose current balance is zero
+        if not balance:
+            continue
+
+        terms = extract_investor_terms_from_entry(entry)
+        key = entry.get("key", "") or entry.get("Key", "")
+        if key and (not terms["start_date"] or not terms["end_date"] or not terms["profit_percentage"]):
+            detail_keys.append(key)
+        loan_accounts.append((entry, key, balance, terms))
+
+    # If any of the key fields are missing, fall back to the more
+    # detailed special-account-form/{key} endpoint, fetched in parallel.
+    progress("details", accounts=total_accounts, detail_lookups=len(detail_keys))
+    details_by_key = fetch_investor_details_bulk(detail_keys)
+    if detail_keys:
+        print(f"[SYNC] Fetched details for {len(details_by_key)} accounts.")
+
+    # Gather "Profit payable" amounts by investor name from special accounts
+    profit_payable_data = {}
+    profit_payable_count = 0
+    for entry in accounts_data:
+        control = (entry.get("controlAccount") or "").strip().lower()
+        if control == "profit payable":
+            name = entry.get("name", "")
+            payable_value = extract_balance_amount(entry)
+            profit_payable_data[name] = payable_value
+            profit_payable_count += 1
+
+    # Keep every new line that hits an investor account; they are
+    # written to the staging table in batches and merged into the local
+    # ledger store on publish. In streaming mode the lines are consumed
+    # straight off the API, so a failure part-way through aborts the sync
+    # instead of storing a partial ledger.
+    sync_id = uuid.uuid4().hex
+    line_count = 0
+    try:
+        # Leftovers of syncs that never published
+        db.session.query(LedgerLineStaging).delete()
+        db.session.commit()
+        batch = []
+        for feed in line_feeds:
+            progress("lines", collection=feed.endpoint)
+            for line in feed:
+                row = ledger_line_row(feed.source, line)
+                if row:
+                    batch.append({"sync_id": sync_id, **row})
+                if len(batch) >= LEDGER_LINE_BATCH_SIZE:
+                    line_count += stage_ledger_lines(batch)
+                    batch = []
+        line_count += stage_ledger_lines(batch)
+    except requests.RequestException as exc:
+        print(f"[SYNC] Error reading ledger lines ({exc}); skipping DB refresh.")
+        return None
+    except SQLAlchemyError as exc:
+        db.session.rollback()
+        print(f"[SYNC] Error staging ledger lines ({exc}); skipping DB refresh.")
+        return None
+
+    # Process investor "Loans payable" accounts. Profit paid (and with it
+    # the current payable) comes from the merged ledger at publish time.
+    investors = {}
+    for entry, key, balance, terms in loan_accounts:
+        name = entry.get("name", "")
+        account_key = key or f"name:{name}"
+        if account_key in investors:
+            print(f"[SYNC] Duplicate account key {account_key!r} for {name!r}; keeping the first entry.")
+            continue
+
+        start_date = terms["start_date"]
+        end_date = terms["end_date"]
+        profit_percentage = terms["profit_percentage"]
+
+        details = details_by_key.get(key)
+        if details:
+            start_date = start_date or details.get("start_date", "")
+            end_date = end_date or details.get("end_date", "")
+            profit_percentage = profit_percentage or details.get("profit_percentage", 0)
+
+        start_date, end_date = ensure_correct_dates(start_date, end_date)
+        # Stored zero-padded, so the SQL accrual refresh reads the same dates
+        start_date = iso_date(start_date) or start_date
+        end_date = iso_date(end_date) or end_date
+
+        investors[account_key] = {
+            "name": name,
+            "base_name": investor_group_key(name),
+            "start_date": start_date,
+            "end_date": end_date,
+            "profit_percentage": profit_percentage,
+            "balance": balance,
+            # For backward compatibility, also assign profit_paid from special accounts if needed
+            "profit_paid": profit_payable_data.get(name, 0),
+            "profit_due": 0,
+            "dividend_paid": 0,
+        }
+
+    # Term / profit figures for all investors in one pass
+    accrued_on = datetime.today().date()
+    accruals = accrue_profit(
+        [values["balance"] for values in investors.values()],
+        [values["profit_percentage"] or 0 for values in investors.values()],
+        [parse_date(values["start_date"]) for values in investors.values()],
+        [parse_date(values["end_date"]) for values in investors.values()],
+    )
+    for values, accrual in zip(investors.values(), accruals):
+        values.update(accrual._asdict())
+
+    return StagedSync(
+        account_rows=ledger_account_rows(accounts_data),
+        line_feeds=line_feeds,
+        sync_id=sync_id,
+        line_count=line_count,
+        investors=investors,
+        profit_payable_count=profit_payable_count,
+        accrued_on=accrued_on,
+    )
+
+
+def publish_sync(staged: StagedSync) -> dict:
+    """
+    Publish a staged generation in a single transaction: merge the ledger
+    store, reconcile the Investor table and advance the SyncState
+    generation pointer when anything the views read changed. Readers see
+    either the previous generation or this one, never a mix. Returns the
+    investor change report plus `changed` and the published generation.
+    """
+    now = datetime.utcnow()
+    try:
+        # Merge into the local ledger store: collections that were fully
+        # downloaded replace what is stored, deltas are appended.
+        db.session.query(LedgerAccount).delete()
+        if staged.account_rows:
+            db.session.execute(insert(LedgerAccount), staged.account_rows)
+        for feed in staged.line_feeds:
+            if feed.full:
+                db.session.query(LedgerLine).filter(LedgerLine.source == feed.source).delete()
+            mark = db.session.get(SyncWatermark, feed.source) or SyncWatermark(source=feed.source)
+            mark.position = feed.position
+            mark.last_key = feed.last_key
+            if feed.full or not mark.last_date:
+                mark.last_date = feed.last_date
+            elif feed.last_date:
+                mark.last_date = max(mark.last_date, feed.last_date)
+            mark.updated_at = now
+            if feed.full:
+                mark.full_synced_at = now
+            db.session.add(mark)
+            print(
+                f"[SYNC] {feed.endpoint}: {'full' if feed.full else 'delta'}, "
+                f"{feed.new_count} lines read (watermark {feed.position})."
+            )
+        staged_lines = select(*(getattr(LedgerLineStaging, column) for column in LEDGER_LINE_COLUMNS)).where(
+            LedgerLineStaging.sync_id == staged.sync_id
+        ).order_by(LedgerLineStaging.id)
+        db.session.execute(insert(LedgerLine).from_select(LEDGER_LINE_COLUMNS, staged_lines))
+        db.session.query(LedgerLineStaging).filter(LedgerLineStaging.sync_id == staged.sync_id).delete()
+        print(f"[SYNC] Stored {len(staged.account_rows)} ledger accounts and {staged.line_count} new ledger lines.")
+
+        # Profit paid per investor from the merged ledger;
+        # Current Payable = total profit payable minus dividend paid
+        ledger = LedgerAggregates(db.session)
+        dividend_paid_data = ledger.profit_paid_by_investor()
+        for values in staged.investors.values():
+            values["dividend_paid"] = dividend_paid_data.get(values["name"], 0)
+        profit_due = accrue_profit_due(
+            [values["profit_payable_up_to_now"] for values in staged.investors.values()],
+            [values["dividend_paid"] for values in staged.investors.values()],
+        )
+        for values, due in zip(staged.investors.values(), profit_due):
+            values["profit_due"] = due
+
+        report = apply_investor_changes(staged.investors)
+
+        group_count, phase_count, summary_changed = write_summary_tables(build_investment_summary_groups(ledger))
+        print(
+            f"[SYNC] Materialized investment summary: {group_count} investors, {phase_count} phases"
+            f"{'' if summary_changed else ' (unchanged)'}."
+        )
+
+        state = db.session.get(SyncState, SYNC_STATE_ID, populate_existing=True)
+        if state is None or state.lease_holder != sync_worker_id():
+            raise SyncLeaseLost(f"sync lease now held by {state.lease_holder if state else None}")
+        # Only a change to what the views read (Investor and the summary
+        # tables) publishes a new generation; otherwise snapshots, cached
+        # views and browser ETags stay valid.
+        report["changed"] = bool(
+            summary_changed or report["inserted"] or report["updated"] or report["deleted"]
+        )
+        if report["changed"] or state.published_at is None:
+            state.generation += 1
+            state.published_at = now
+        state.checked_at = now
+        state.accrued_on = staged.accrued_on
+        db.session.add(state)
+        db.session.commit()
+    except (SQLAlchemyError, SyncLeaseLost):
+        db.session.rollback()
+        raise
+
+    report["generation"] = state.generation
+    return report
+
+
+def _month_index(column):
+    """
+    year * 12 + month of a YYYY-MM-DD column; NULL unless it holds a valid
+    zero-padded date (the sync stores dates through iso_date).
+    """
+    return case(
+        (
+            func.date(column, "+0 days") == column,  # "+0 days" turns 02-30 into 03-01
+            cast(func.substr(column, 1, 4), db.Integer) * 12 + cast(func.substr(column, 6, 2), db.Integer),
+        ),
+        else_=None,
+    )
+
+
+def refresh_accruals(today=None):
+    """
+    Roll the time-dependent Investor columns (remaining months, profit
+    payable up to now, current payable) forward to `today` from the stored
+    dates, monthly profit and dividend paid - the same arithmetic as
+    accrue_profit / accrue_profit_due, as one UPDATE and without calling
+    Manager.io. Runs at most once per day across all processes: the day is
+    claimed on SyncState.accrued_on, and a new generation is published when
+    any investor changed. Returns the number of investors updated, or None
+    when the figures were already current.
+    """
+    today = today or datetime.today().date()
+    today_month = today.year * 12 + today.month
+    try:
+        claimed = db.session.execute(
+            update(SyncState)
+            .where(
+                SyncState.id == SYNC_STATE_ID,
+                or_(SyncState.accrued_on.is_(None), SyncState.accrued_on < today),
+            )
+            .values(accrued_on=today)
+        ).rowcount
+        if not claimed:
+            db.session.rollback()
+            return None
+
+        remaining = func.coalesce(func.max(_month_index(Investor.end_date) - today_month, 0), 0)
+        elapsed = func.coalesce(func.max(today_month - _month_index(Investor.start_date), 0), 0)
+        payable = elapsed * func.coalesce(Investor.monthly_profit, 0)
+        due = func.max(payable - func.coalesce(Investor.dividend_paid, 0), 0)
+        changed = db.session.execute(
+            update(Investor)
+            .where(or_(
+                Investor.remaining_months.is_distinct_from(remaining),
+                Investor.profit_payable_up_to_now.is_distinct_from(payable),
+                Investor.profit_due.is_distinct_from(due),
+            ))
+            .values(remaining_months=remaining, profit_payable_up_to_now=payable, profit_due=due)
+            .execution_options(synchronize_session=False)
+        ).rowcount
+        if changed:
+            db.session.execute(
+                update(SyncState)
+                .where(SyncState.id == SYNC_STATE_ID)
+                .values(generation=SyncState.generation + 1)
+            )
+        db.session.commit()
+    except SQLAlchemyError:
+        db.session.rollback()
+        raise
+
+    print(f"[SYNC] Accruals rolled forward to {today.isoformat()}: {changed} investors updated.")
+    return changed
+
+
+class SyncLeaseLost(RuntimeError):
+    """Raised when a sync is about to publish without holding the lease."""
+
+
+def sync_worker_id() -> str:
+    """Identifies this process as a sync lease holder."""
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+def acquire_sync_lease():
+    """
+    Take (or renew) the cross-process sync lease. Succeeds when the lease
+    is free, expired or already ours. Returns the current holder, which is
+    sync_worker_id() on success.
+    """
+    worker_id = sync_worker_id()
+    now = datetime.utcnow()
+    try:
+        if db.session.get(SyncState, SYNC_STATE_ID) is None:
+            db.session.add(SyncState(id=SYNC_STATE_ID, generation=0))
+            db.session.commit()
+    except IntegrityError:
+        db.session.rollback()  # another process created the row first
+
+    try:
+        db.session.execute(
+            update(SyncState)
+            .where(
+                SyncState.id == SYNC_STATE_ID,
+                or_(
+                    SyncState.lease_holder.is_(None),
+                    SyncState.lease_holder == worker_id,
+                    SyncState.lease_expires_at < now,
+                ),
+            )
+            .values(lease_holder=worker_id, lease_expires_at=now + timedelta(seconds=SYNC_LEASE_SECONDS))
+        )
+        db.session.commit()
+    except SQLAlchemyError as exc:
+        db.session.rollback()
+        print(f"[SYNC] Could not take the sync lease ({exc}).")
+        return None
+    return db.session.get(SyncState, SYNC_STATE_ID, populate_existing=True).lease_holder
+
+
+def release_sync_lease():
+    try:
+        db.session.execute(
+            update(SyncState)
+            .where(SyncState.id == SYNC_STATE_ID, SyncState.lease_holder == sync_worker_id())
+            .values(lease_holder=None, lease_expires_at=None)
+        )
+        db.session.commit()
+    except SQLAlchemyError as exc:
+        db.session.rollback()
+        print(f"[SYNC] Could not release the sync lease ({exc}); it expires on its own.")
+
+
+def update_database(force: bool = False, full_resync: bool = False, progress=_no_progress):
+    """
+    Pull fresh data from Manager.io APIs and refresh the Investor table
+    and the local ledger store (LedgerAccount / LedgerLine).
+    Runs at most once every UPDATE_INTERVAL_SECONDS unless force=True.
+    Ledger lines are fetched incrementally from the stored watermarks
+    unless full_resync=True (or a full resync is due).
+    Wrapped in a process-wide lock, and in the database sync lease so only
+    one process syncs at a time; the interval is measured from the last
+    completed sync by any process.
+
+    The new data is staged completely (stage_sync) and then published
+    atomically as a new generation (publish_sync).
+
+    Returns the investor change report from apply_investor_changes() with
+    the published generation, or None when the sync was skipped.
+    progress is forwarded to stage_sync (see SyncJob.advance).
+    """
+    with db_update_lock:
+        holder = acquire_sync_lease()
+        if holder != sync_worker_id():
+            if holder:
+                print(f"[SYNC] Sync lease held by {holder}; skipping.")
+                progress("skipped", lease_holder=holder)
+            return None
+        try:
+            return _update_database_leased(force, full_resync, progress)
+        finally:
+            release_sync_lease()
+
+
+def _update_database_leased(force: bool, full_resync: bool, progress):
+    state = db.session.get(SyncState, SYNC_STATE_ID, populate_existing=True)
+    last_checked = state and (state.checked_at or state.published_at)
+    if not force and last_checked is not None:
+        elapsed = (datetime.utcnow() - last_checked).total_seconds()
+        if elapsed < UPDATE_INTERVAL_SECONDS:
+            return None
+
+    def renewing_progress(stage: str, **details):
+        acquire_sync_lease()
+        progress(stage, **details)
+
+    staged = stage_sync(full_resync, renewing_progress)
+    if staged is None:
+        return None
+
+    renewing_progress("publishing", line_rows=staged.line_count, investors=len(staged.investors))
+    try:
+        report = publish_sync(staged)
+    except (SQLAlchemyError, SyncLeaseLost) as exc:
+        print(f"[SYNC] Error publishing sync ({exc}); previous data kept.")
+        return None
+
+    print(f"[SYNC] Profit Payable entries: {staged.profit_payable_count}, Loans payable entries: {len(staged.investors)}")
+    print(
+        f"[SYNC] Investors: {report['inserted']} inserted, {report['updated']} updated, "
+        f"{report['deleted']} deleted, {report['unchanged']} unchanged "
+        f"(generation {report['generation']}{'' if report['changed'] else ', nothing new to publish'})."
+    )
+    return report
+
+
+# ---------------------------
+# Background Sync
+# ---------------------------
+SYNC_JOB_HISTORY = 20  # finished jobs kept for the status endpoint
+
+
+class SyncJob:
+    """
+    One sync run executed by the background worker. Status moves from
+    "queued" to "running" and ends as "succeeded", "skipped" (nothing was
+    published) or "failed"; `stage` and `details` report progress.
+    Every trigger coalesced into the job shares its result (see wait()).
+    """
+
+    def __init__(self, trigger: str, full_resync: bool = False):
+        self.id = uuid.uuid4().hex[:12]
+        self.trigger = trigger
+        self.full_resync = full_resync
+        self.status = "queued"
+        self.stage = None
+        self.details = {}
+        self.report = None
+        self.error = None
+        self.created_at = datetime.utcnow()
+        self.started_at = None
+        self.finished_at = None
+        self.triggers = 1
+        self._done = Event()
+
+    @property
+    def finished(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: float = None):
+        """Block until the job has finished; returns its report (or None)."""
+        self._done.wait(timeout)
+        return self.report
+
+    def covers(self, full_resync: bool) -> bool:
+        """Whether this job's result satisfies a trigger for full_resync."""
+        return self.full_resync or not full_resync
+
+    def advance(self, stage: str, **details):
+        self.stage = stage
+        self.details = {**self.details, **details}
+
+    def to_dict(self) -> dict:
+        def iso(value):
+            return value.isoformat() + "Z" if value else None
+
+        return {
+            "id": self.id,
+            "trigger": self.trigger,
+            "triggers": self.triggers,
+            "full_resync": self.full_resync,
+            "status": self.status,
+            "stage": self.stage,
+            "details": dict(self.details),
+            "report": self.report,
+            "error": self.error,
+            "created_at": iso(self.created_at),
+            "started_at": iso(self.started_at),
+            "finished_at": iso(self.finished_at),
+        }
+
+
+sync_jobs = {}  # job id -> SyncJob, oldest first
+sync_jobs_lock = Lock()
+sync_queue = queue.Queue()
+sync_worker = None
+
+
+def _remember_job(job: SyncJob):
+    with sync_jobs_lock:
+        sync_jobs[job.id] = job
+        finished = [j for j in sync_jobs.values() if j.finished_at]
+        for old in finished[:-SYNC_JOB_HISTORY]:
+            del sync_jobs[old.id]
+
+
+def get_sync_job(job_id: str = None):
+    """A tracked job by id, or the most recent one when job_id is None."""
+    with sync_jobs_lock:
+        if job_id is not None:
+            return sync_jobs.get(job_id)
+        return next(reversed(sync_jobs.values()), None)
+
+
+def run_sync_job(job: SyncJob):
+    """Run a job to completion on the calling thread."""
+    with sync_jobs_lock:
+        job.status = "running"
+        job.started_at = datetime.utcnow()
+    try:
+        with app.app_context():
+            # Scheduled runs respect the interval since the last publish
+            # by any process; triggered runs always sync.
+            job.report = update_database(
+                force=job.trigger != "schedule", full_resync=job.full_resync, progress=job.advance
+            )
+            if job.report is not None:
+                dashboard_snapshot()
+        job.status = "succeeded" if job.report is not None else "skipped"
+    except Exception as exc:
+        job.status = "failed"
+        job.error = str(exc)
+        print(f"[SYNC] Job {job.id} failed: {exc}")
+    finally:
+        job.stage = "done"
+        job.finished_at = datetime.utcnow()
+        _remember_job(job)
+        job._done.set()
+
+
+def _next_sync_delay():
+    if not SYNC_SCHEDULER_ENABLED:
+        return None
+    return UPDATE_INTERVAL_SECONDS + random.uniform(0, SYNC_JITTER_SECONDS)
+
+
+def _seconds_until_tomorrow():
+    now = datetime.today()
+    midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+    return (midnight - now).total_seconds() + 1
+
+
+def run_accrual_refresh():
+    """refresh_accruals() for the worker; a failure is logged and retried on its next wake-up."""
+    try:
+        with app.app_context():
+            if refresh_accruals():
+                dashboard_snapshot()
+        return True
+    except Exception as exc:
+        print(f"[SYNC] Accrual refresh failed: {exc}")
+        return False
+
+
+def _sync_worker_loop():
+    """
+    Run queued sync jobs one at a time, and a scheduled sync whenever
+    nothing was queued for UPDATE_INTERVAL_SECONDS (plus jitter). The
+    worker also wakes at each day rollover to refresh the accruals, so
+    they stay current even when no sync runs (scheduler off, API down).
+    """
+    delay = _next_sync_delay()
+    next_sync_at = None if delay is None else time.monotonic() + delay
+    accruals_checked_on = None
+    while True:
+        today = datetime.today().date()
+        if accruals_checked_on != today and run_accrual_refresh():
+            accruals_checked_on = today
+        timeout = _seconds_until_tomorrow()
+        if next_sync_at is not None:
+            timeout = max(0, min(timeout, next_sync_at - time.monotonic()))
+        try:
+            job = sync_queue.get(timeout=timeout)
+        except queue.Empty:
+            if next_sync_at is None or time.monotonic() < next_sync_at:
+                continue
+            job = SyncJob("schedule")
+            _remember_job(job)
+        run_sync_job(job)
+        delay = _next_sync_delay()
+        next_sync_at = None if delay is None else time.monotonic() + delay
+
+
+def start_sync_worker():
+    """
+    Start the background sync thread once per process. The first sync is
+    queued straight away when nothing has been published yet.
+    """
+    global sync_worker
+    with sync_jobs_lock:
+        if sync_worker is not None:
+            return
+        sync_worker = Thread(target=_sync_worker_loop, name="ims-sync", daemon=True)
+        sync_worker.start()
+    if current_generation()[0] == 0:
+        trigger_sync("startup")
+
+
+def _coalesce_sync(full_resync: bool):
+    """
+    The job a new trigger can share, if any: one still queued (upgraded to a
+    full resync when asked for), one running, or one that succeeded less
+    than SYNC_DEBOUNCE_SECONDS ago. Call with sync_jobs_lock held.
+    """
+    now = datetime.utcnow()
+    for job in reversed(sync_jobs.values()):
+        if job.status == "queued":
+            job.full_resync = job.full_resync or full_resync
+            return job
+        if job.status == "running" and job.covers(full_resync):
+            return job
+        if (
+            job.status == "succeeded"
+            and job.covers(full_resync)
+            and (now - job.finished_at).total_seconds() < SYNC_DEBOUNCE_SECONDS
+        ):
+            return job
+    return None
+
+
+def trigger_sync(trigger: str = "manual", full_resync: bool = False):
+    """
+    Request a sync on the background worker. Returns (job, coalesced):
+    coalesced is True when the trigger attached to an existing job rather
+    than queueing a new one.
+    """
+    with sync_jobs_lock:
+        job = _coalesce_sync(full_resync)
+        if job is not None:
+            job.triggers += 1
+            return job, True
+        job = SyncJob(trigger, full_resync)
+        sync_jobs[job.id] = job
+    sync_queue.put(job)
+    return job, False
+
+# ---------------------------
+# Response Compression
+# ---------------------------
+COMPRESSIBLE_MIMETYPES = {"text/html", "application/json"}
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def negotiated_encoding():
+    """Content-Encoding to use for this request: "br" (with brotli installed), "gzip" or None."""
+    if not COMPRESSION_ENABLED:
+        return None
+    accepted = request.accept_encodings
+    if brotli is not None and accepted["br"]:
+        return "br"
+    if accepted["gzip"]:
+        return "gzip"
+    return None
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY)
+    # mtime=0 keeps the output identical for identical bodies (strong ETags)
+    return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+
+
+def _compressible(response) -> bool:
+    return (
+        response.status_code == 200
+        and not response.direct_passthrough
+        and response.mimetype in COMPRESSIBLE_MIMETYPES
+        and "Content-Encoding" not in response.headers
+        and len(response.get_data()) >= COMPRESS_MIN_BYTES
+    )
+
+
+def _set_encoded_body(response, body: bytes, encoding: str):
+    response.set_data(body)
+    response.headers["Content-Encoding"] = encoding
+    etag, weak = response.get_etag()
+    if etag:
+        response.set_etag(f"{etag}-{encoding}", weak)
+
+
+@app.after_request
+def compress_response(response):
+    """Compress large HTML/JSON responses (cached views arrive already compressed)."""
+    if response.mimetype in COMPRESSIBLE_MIMETYPES:
+        response.vary.add("Accept-Encoding")
+    if _compressible(response):
+        encoding = negotiated_encoding()
+        if encoding:
+            _set_encoded_body(response, compress_body(response.get_data(), encoding), encoding)
+    return response
+
+# ---------------------------
+# Result Cache
+# ---------------------------
+class MemoryResultCache:
+    """Per-process LRU of computed view results ((mimetype, body) pairs)."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # key -> (generation, result)
+        self._lock = Lock()
+
+    def get(self, key: str):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key: str, generation: int, result):
+        with self._lock:
+            for stale in [k for k, (gen, _) in self._entries.items() if gen < generation]:
+                del self._entries[stale]
+            self._entries[key] = (generation, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+class SQLiteResultCache:
+    """
+    LRU of computed view results in a SQLite file shared by every app
+    process on the host, so a view is computed once per generation rather
+    than once per worker, and the cache survives restarts.
+    """
+
+    def __init__(self, path: str, max_entries: int, pool_size: int):
+        self.path = path
+        self.max_entries = max_entries
+        self._idle = queue.LifoQueue(maxsize=pool_size)  # connections shared by all threads
+        with self._connection() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS result_cache ("
+                "key TEXT PRIMARY KEY, generation INTEGER NOT NULL, mimetype TEXT NOT NULL, "
+                "body BLOB NOT NULL, used_at REAL NOT NULL)"
+            )
+
+    @contextmanager
+    def _connection(self):
+        """An idle pooled connection (or a new one), returned to the pool after use."""
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = sqlite3.connect(
+                self.path,
+                timeout=SQLITE_BUSY_TIMEOUT_MS / 1000,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        try:
+            yield conn
+        finally:
+            try:
+                self._idle.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    def get(self, key: str):
+        with self._connection() as conn:
+            row = conn.execute(
+                "SELECT mimetype, body, used_at FROM result_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            # Hits only write when the LRU position is stale, so most
+            # lookups stay plain reads that never wait for the write lock.
+            now = time.time()
+            if now - row[2] >= RESULT_CACHE_TOUCH_SECONDS:
+                conn.execute(
+                    "UPDATE result_cache SET used_at = ? WHERE key = ? AND used_at < ?",
+                    (now, key, now - RESULT_CACHE_TOUCH_SECONDS),
+                )
+        return row[0], bytes(row[1])
+
+    def set(self, key: str, generation: int, result):
+        mimetype, body = result
+        with self._connection() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.execute("DELETE FROM result_cache WHERE generation < ?", (generation,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO result_cache (key, generation, mimetype, body, used_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, generation, mimetype, body, time.time()),
+                )
+                conn.execute(
+                    "DELETE FROM result_cache WHERE key NOT IN "
+                    "(SELECT key FROM result_cache ORDER BY used_at DESC LIMIT ?)",
+                    (self.max_entries,),
+                )
+                conn.execute("COMMIT")
+            except sqlite3.Error:
+                conn.execute("ROLLBACK")
+                raise
+
+
+def make_result_cache(backend: str):
+    if backend == "none":
+        return None
+    if backend == "memory":
+        return MemoryResultCache(RESULT_CACHE_MAX_ENTRIES)
+    if backend == "sqlite":
+        path = RESULT_CACHE_PATH or os.path.join(app.instance_path, "result_cache.db")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        return SQLiteResultCache(path, RESULT_CACHE_MAX_ENTRIES, SQLITE_READ_POOL_SIZE)
+    raise ValueError(f"Unknown IMS_RESULT_CACHE {backend!r}")
+
+
+result_cache = make_result_cache(RESULT_CACHE_BACKEND)
+
+
+def _code_files():
+    """The files a rendered view depends on besides the data: code, config and templates."""
+    template_dir = os.path.join(app.root_path, app.template_folder)
+    templates = sorted(
+        os.path.join(root, name) for root, _, names in os.walk(template_dir) for name in names
+    )
+    return [os.path.abspath(__file__), os.path.join(app.root_path, "config.py"), *templates]
+
+
+def _code_version():
+    """
+    (version, last modified) of the running code: BUILD_VERSION or a hash
+    of _code_files(), and their latest mtime as an aware UTC datetime.
+    """
+    digest = hashlib.sha1()
+    modified = 0
+    for path in _code_files():
+        with open(path, "rb") as handle:
+            digest.update(os.path.relpath(path, app.root_path).encode("utf-8") + b"\0" + handle.read())
+        modified = max(modified, int(os.path.getmtime(path)))
+    return BUILD_VERSION or digest.hexdigest()[:12], datetime.fromtimestamp(modified, timezone.utc)
+
+
+# Part of every cached view key and ETag, so a deploy never serves (or
+# confirms with 304) pages rendered by the previous code.
+CODE_VERSION, CODE_MODIFIED_AT = _code_version()
+
+
+def _generation_validators():
+    """
+    (generation, last modified) of the published data: the latest of the
+    sync publish time, the start of the day accruals were rolled to and
+    CODE_MODIFIED_AT, as an aware UTC datetime (None before the first
+    sync).
+    """
+    state = read_session().execute(
+        select(SyncState.generation, SyncState.published_at, SyncState.accrued_on)
+        .where(SyncState.id == SYNC_STATE_ID)
+    ).first()
+    if state is None or state.published_at is None:
+        return (state.generation if state else 0), None
+    last_modified = max(state.published_at.replace(tzinfo=timezone.utc), CODE_MODIFIED_AT)
+    if state.accrued_on:
+        accrued_at = datetime.combine(state.accrued_on, datetime.min.time()).astimezone(timezone.utc)
+        last_modified = max(last_modified, accrued_at)
+    return state.generation, last_modified.replace(microsecond=0)
+
+
+def _not_modified(etag: str, last_modified):
+    """
+    The ETag to answer 304 with when the request's validators still match
+    (any encoding of `etag`), else None. If-None-Match wins over
+    If-Modified-Since.
+    """
+    if request.if_none_match:
+        for candidate in (etag, f"{etag}-gzip", f"{etag}-br"):
+            if request.if_none_match.contains(candidate):
+                return candidate
+        return None
+    since = request.if_modified_since
+    return etag if since and last_modified and last_modified <= since else None
+
+
+def _with_validators(response, etag: str, last_modified):
+    response.set_etag(etag)
+    if last_modified:
+        response.last_modified = last_modified
+    # Browsers must revalidate (a cheap 304) instead of guessing freshness
+    response.cache_control.private = True
+    response.cache_control.no_cache = True
+    return response
+
+
+def _cache_get(key: str):
+    if result_cache is None:
+        return None
+    try:
+        return result_cache.get(key)
+    except sqlite3.Error as exc:
+        print(f"[CACHE] Lookup of {key} failed: {exc}")
+        return None
+
+
+def _cache_set(key: str, generation: int, result):
+    if result_cache is None:
+        return
+    try:
+        result_cache.set(key, generation, result)
+    except sqlite3.Error as exc:
+        print(f"[CACHE] Storing {key} failed: {exc}")
+
+
+def cached_view(view):
+    """
+    Serve a view for the published sync generation. Responses carry a
+    strong ETag (code version + generation + endpoint + query string) and
+    Last-Modified;
+    a request whose If-None-Match / If-Modified-Since still match gets a
+    304 before the view or the cache is touched. Otherwise the body comes
+    from result_cache or is computed and stored there (200 responses only;
+    cache errors are logged and the view is computed as usual). Bodies
+    compressed for the client's Accept-Encoding are cached the same way,
+    under the encoding-suffixed key and ETag.
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        generation, last_modified = _generation_validators()
+        variant = f"{request.endpoint}:{request.query_string.decode('latin-1')}"
+        etag = f"{CODE_VERSION}-g{generation}-{hashlib.sha1(variant.encode('utf-8')).hexdigest()[:16]}"
+        matched = _not_modified(etag, last_modified)
+        if matched:
+            return _with_validators(app.response_class(status=304), matched, last_modified)
+
+        key = f"{request.endpoint}:{CODE_VERSION}:{generation}:{request.query_string.decode('latin-1')}"
+        encoding = negotiated_encoding()
+        if encoding:
+            cached = _cache_get(f"{key}:{encoding}")
+            if cached is not None:
+                mimetype, body = cached
+                response = _with_validators(app.response_class(mimetype=mimetype), etag, last_modified)
+                _set_encoded_body(response, body, encoding)
+                return response
+
+        cached = _cache_get(key)
+        if cached is not None:
+            mimetype, body = cached
+            response = app.response_class(body, mimetype=mimetype)
+        else:
+            response = make_response(view(*args, **kwargs))
+            if response.status_code != 200 or response.direct_passthrough:
+                return response
+            _cache_set(key, generation, (response.mimetype, response.get_data()))
+
+        response = _with_validators(response, etag, last_modified)
+        if encoding and _compressible(response):
+            body = compress_body(response.get_data(), encoding)
+            _cache_set(f"{key}:{encoding}", generation, (response.mimetype, body))
+            _set_encoded_body(response, body, encoding)
+        return response
+    return wrapper
+
+@app.before_request
+def before_request():
+    # Syncs run on a background thread, started with the first request;
+    # requests themselves never wait on Manager.io.
+    if sync_worker is None:
+        start_sync_worker()
+
+    # --- Authentication guard ---
+    # Allow unauthenticated access to the login page, health check and static assets.
+    open_endpoints = {'login', 'healthcheck'}
+    endpoint = request.endpoint or ''
+    if endpoint in open_endpoints or endpoint.startswith('static'):
+        return
+
+    # If neither an environment-based admin password nor a stored
+    # AdminUser exists, do not allow access beyond login.
+    has_db_admin = AdminUser.query.first() is not None
+    if not ADMIN_PASSWORD and not has_db_admin:
+        return redirect(url_for('login'))
+
+    if not session.get('logged_in'):
+        return redirect(url_for('login'))
+
+
+@app.route('/login', methods=['GET', 'POST'])
+def login():
+    if session.get('logged_in'):
+        return redirect(url_for('home'))
+
+    error = None
+    if request.method == 'POST':
+        username = (request.form.get('username') or '').strip()
+        password = request.form.get('password') or ''
+
+        admin_user = AdminUser.query.first()
+        if admin_user:
+            if username == admin_user.username and check_password_hash(admin_user.password_hash, password):
+                session['logged_in'] = True
+                session['admin_username'] = admin_user.username
+                return redirect(url_for('home'))
+            else:
+                error = "Invalid username or password"
+        else:
+            if username == ADMIN_USERNAME and password == ADMIN_PASSWORD:
+                session['logged_in'] = True
+                session['admin_username'] = ADMIN_USERNAME
+                return redirect(url_for('home'))
+            else:
                 error = "Invalid username or password"
 
     return render_template('login.html', error=error, env_label=ENV_LABEL)
@@ -738,71 +2718,261 @@ def healthcheck():
 # ---------------------------
 # Home Route (Table View)
 # ---------------------------
+DASHBOARD_SUM_COLUMNS = ("monthly_profit", "balance", "profit_payable_up_to_now", "dividend_paid", "profit_due")
+
+
+def dashboard_rows():
+    """
+    All dashboard figures in one query: a "phase" row per Investor, a
+    "group" row per base name and one "total" row over every investor -
+    ROLLUP(base_name) spelled as UNION ALL so it also runs on SQLite.
+
+    A group's start/end dates span its phases, and its Profit % is the
+    last non-zero one in name order (a correlated subquery).
+    """
+    peer = aliased(Investor)
+    group_profit_percentage = (
+        select(peer.profit_percentage)
+        .where(peer.base_name == Investor.base_name, peer.profit_percentage != 0)
+        .order_by(peer.name.desc())
+        .limit(1)
+        .scalar_subquery()
+    )
+
+    def sums():
+        return [func.coalesce(func.sum(getattr(Investor, column)), 0) for column in DASHBOARD_SUM_COLUMNS]
+
+    phases = select(
+        literal("phase").label("kind"),
+        Investor.base_name,
+        Investor.name,
+        Investor.start_date,
+        Investor.end_date,
+        Investor.duration_months,
+        Investor.remaining_months,
+        Investor.profit_percentage,
+        *(getattr(Investor, column) for column in DASHBOARD_SUM_COLUMNS),
+    )
+    groups = select(
+        literal("group"),
+        Investor.base_name,
+        func.min(Investor.name),
+        func.min(func.nullif(Investor.start_date, "")),
+        func.max(func.nullif(Investor.end_date, "")),
+        null(),
+        null(),
+        group_profit_percentage,
+        *sums(),
+    ).group_by(Investor.base_name)
+    total = select(literal("total"), null(), null(), null(), null(), null(), null(), null(), *sums())
+
+    return read_session().execute(union_all(phases, groups, total)).all()
+
+
+@lru_cache(maxsize=1)
+def _bar_chart_layout_json():
+    """
+    JSON of the dashboard bar chart layout, including the default Plotly
+    template. plotly is only imported here, the first time a chart is built.
+    """
+    import plotly.graph_objs as go
+    from plotly.utils import PlotlyJSONEncoder
+
+    figure = go.Figure()
+    figure.update_layout(
+        height=420,
+        margin=dict(l=220, r=40, t=40, b=40),
+        xaxis=dict(
+            title="Balance Amount (Tk)",
+            tickprefix="Tk ",
+            separatethousands=True,
+            gridcolor="rgba(148, 163, 184, 0.3)",
+            zerolinecolor="rgba(148, 163, 184, 0.5)",
+        ),
+        yaxis=dict(automargin=True),
+        showlegend=False,
+        plot_bgcolor="#ffffff",
+        paper_bgcolor="#f9fafb",
+        title=dict(text="Investor's Investment Distribution", x=0.5),
+    )
+    return json.dumps(json.loads(json.dumps(figure, cls=PlotlyJSONEncoder))["layout"])
+
+
+def build_bar_chart_json(groups):
+    """
+    Plotly figure JSON for the dashboard's horizontal bar chart of group
+    balances (largest first). The trace is a plain dict in the order
+    go.Bar serialises it, so the output matches go.Figure's.
+    """
+    bar_pairs = sorted(((g.name, g.balance) for g in groups), key=lambda x: x[1] or 0, reverse=True)
+    trace = {
+        "hovertemplate": "%{y}<br>Tk %{x:,.0f}<extra></extra>",
+        "marker": {"color": "rgba(59, 130, 246, 0.85)", "line": {"color": "rgba(37, 99, 235, 1)", "width": 1.2}},
+        "orientation": "h",
+        "x": [balance for _, balance in bar_pairs],
+        "y": [name for name, _ in bar_pairs],
+        "type": "bar",
+    }
+    return f'{{"data": [{json.dumps(trace)}], "layout": {_bar_chart_layout_json()}}}'
+
+
+class InvestorRecord(NamedTuple):
+    """A dashboard phase row (one Investor)."""
+    name: str
+    base_name: str
+    start_date: str
+    end_date: str
+    duration_months: int
+    remaining_months: int
+    profit_percentage: float
+    monthly_profit: float
+    balance: float
+    profit_payable_up_to_now: float
+    dividend_paid: float
+    profit_due: float
+
+
+class InvestorGroupRecord(NamedTuple):
+    """A dashboard group (base name) with its phase rows in name order."""
+    name: str
+    first_name: str
+    start_date: str
+    end_date: str
+    duration_months: int
+    remaining_months: int
+    profit_percentage: float
+    balance: float
+    monthly_profit: float
+    members: tuple
+
+
+class DashboardSnapshot(NamedTuple):
+    """
+    What `/`, /chart_data and /gantt_data show for one published
+    generation, built once and shared read-only by every request until
+    a newer generation replaces it as a whole.
+    """
+    generation: int
+    published_at: datetime
+    investors: tuple  # InvestorRecord, in table order
+    groups: tuple  # InvestorGroupRecord, in first-name order
+    totals: MappingProxyType  # DASHBOARD_SUM_COLUMNS -> total over all investors
+    bar_chart_json: str  # unfiltered dashboard bar chart
+    size_bytes: int
+
+
+dashboard_snapshot_current = None
+dashboard_snapshot_lock = Lock()
+
+
+def _published_generation():
+    state = read_session().execute(
+        select(SyncState.generation, SyncState.published_at).where(SyncState.id == SYNC_STATE_ID)
+    ).first()
+    return tuple(state) if state else (0, None)
+
+
+def _deep_sizeof(obj, seen):
+    """Bytes held by obj and everything it references, each object counted once."""
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, tuple):
+        size += sum(_deep_sizeof(item, seen) for item in obj)
+    elif isinstance(obj, (dict, MappingProxyType)):
+        size += sum(_deep_sizeof(k, seen) + _deep_sizeof(v, seen) for k, v in obj.items())
+    return size
+
+
+def build_dashboard_snapshot():
+    """DashboardSnapshot of the published generation, from dashboard_rows()."""
+    # Read the generation before the rows: a sync publishing in between
+    # then only makes this snapshot look older than its data.
+    generation, published_at = _published_generation()
+
+    investors = []
+    members = {}
+    group_rows = []
+    totals = dict.fromkeys(DASHBOARD_SUM_COLUMNS, 0)
+    for row in dashboard_rows():
+        if row.kind == "phase":
+            record = InvestorRecord._make(getattr(row, field) for field in InvestorRecord._fields)
+            investors.append(record)
+            members.setdefault(row.base_name, []).append(record)
+        elif row.kind == "group":
+            group_rows.append(row)
+        else:
+            totals = {column: getattr(row, column) for column in DASHBOARD_SUM_COLUMNS}
+
+    groups = []
+    for row in group_rows:
+        start_dt = parse_date(row.start_date) if row.start_date and row.end_date else None
+        end_dt = parse_date(row.end_date) if row.start_date and row.end_date else None
+        groups.append(InvestorGroupRecord(
+            name=row.base_name,
+            first_name=row.name,
+            start_date=row.start_date,
+            end_date=row.end_date,
+            duration_months=calculate_months_difference(start_dt, end_dt) if start_dt else None,
+            remaining_months=calculate_remaining_months(end_dt) if end_dt else 0,
+            profit_percentage=row.profit_percentage or 0.0,
+            balance=row.balance,
+            monthly_profit=row.monthly_profit,
+            members=tuple(sorted(members[row.base_name], key=lambda record: record.name)),
+        ))
+    groups.sort(key=lambda group: group.first_name)
+
+    snapshot = DashboardSnapshot(
+        generation, published_at, tuple(investors), tuple(groups), MappingProxyType(totals),
+        build_bar_chart_json(groups), 0,
+    )
+    return snapshot._replace(size_bytes=_deep_sizeof(snapshot, set()))
+
+
+def dashboard_snapshot():
+    """
+    The DashboardSnapshot for the published generation. Checking it costs
+    one single-row read; when a sync or accrual refresh (in any process)
+    has published a newer generation, the first caller rebuilds it.
+    """
+    global dashboard_snapshot_current
+    snapshot = dashboard_snapshot_current
+    generation = _published_generation()[0]
+    if snapshot is not None and snapshot.generation == generation:
+        return snapshot
+
+    with dashboard_snapshot_lock:
+        snapshot = dashboard_snapshot_current
+        if snapshot is None or snapshot.generation != generation:
+            snapshot = build_dashboard_snapshot()
+            dashboard_snapshot_current = snapshot
+            print(
+                f"[SYNC] Dashboard snapshot for generation {snapshot.generation}: "
+                f"{len(snapshot.investors)} investors, {len(snapshot.groups)} groups, "
+                f"{snapshot.size_bytes / 1024:.1f} KiB "
+                f"({snapshot.size_bytes // max(1, len(snapshot.investors))} bytes per investor)."
+            )
+    return snapshot
+
+
 @app.route('/')
+@cached_view
 def home():
     search_query = (request.args.get("q") or "").strip()
     search_lower = search_query.lower()
 
-    raw_investors = Investor.query.order_by(Investor.name).all()
-
-    # Group investors by base name but keep per-phase rows.
-    groups = {}
-    for inv in raw_investors:
-        base_name, phase_label, display_name = split_investor_variant(inv.name)
-        key = base_name or inv.name or "Unknown"
-
-        g = groups.get(key)
-        if not g:
-            g = groups[key] = {
-                "name": key,
-                "start_date": None,
-                "end_date": None,
-                "duration_months": None,
-                "remaining_months": 0,
-                "profit_percentage": 0.0,
-                "balance": 0.0,
-                "monthly_profit": 0.0,
-                "members": [],
-            }
-        g["members"].append(inv)
-
-        g["balance"] += inv.balance or 0.0
-        g["monthly_profit"] += inv.monthly_profit or 0.0
-
-        if inv.start_date:
-            if not g["start_date"] or inv.start_date < g["start_date"]:
-                g["start_date"] = inv.start_date
-        if inv.end_date:
-            if not g["end_date"] or inv.end_date > g["end_date"]:
-                g["end_date"] = inv.end_date
-
-        if inv.profit_percentage:
-            g["profit_percentage"] = inv.profit_percentage
-
-    # Derive duration and remaining months per group using aggregated dates
-    for g in groups.values():
-        start_date = g["start_date"]
-        end_date = g["end_date"]
-        if start_date and end_date:
-            start_dt = parse_date(start_date)
-            end_dt = parse_date(end_date)
-            g["duration_months"] = calculate_months_difference(start_dt, end_dt)
-            g["remaining_months"] = calculate_remaining_months(end_dt)
-        else:
-            g["duration_months"] = None
-            g["remaining_months"] = 0
+    snapshot = dashboard_snapshot()
+    groups = snapshot.groups
+    totals = snapshot.totals
 
     # Optional filtering by investor name (group or member)
     if search_query:
-        filtered_groups = {}
-        for key, g in groups.items():
-            key_match = search_lower in (key or "").lower()
-            member_match = any(
-                search_lower in (m.name or "").lower()
-                for m in g["members"]
-            )
-            if key_match or member_match:
-                filtered_groups[key] = g
+        filtered_groups = [
+            group for group in groups
+            if search_lower in (group.name or "").lower()
+            or any(search_lower in (m.name or "").lower() for m in group.members)
+        ]
     else:
         filtered_groups = groups
 
@@ -810,8 +2980,8 @@ def home():
     # Order groups by total balance (largest to smallest),
     # and within each group order phases by balance as well.
     table_rows = []
-    for key, g in sorted(filtered_groups.items(), key=lambda item: (item[1]["balance"] or 0), reverse=True):
-        for inv in sorted(g["members"], key=lambda inv: (inv.balance or 0), reverse=True):
+    for group in sorted(filtered_groups, key=lambda group: (group.balance or 0), reverse=True):
+        for inv in sorted(group.members, key=lambda inv: (inv.balance or 0), reverse=True):
             table_rows.append({
                 "kind": "phase",
                 "name": inv.name,
@@ -825,67 +2995,32 @@ def home():
             })
         table_rows.append({
             "kind": "total",
-            "name": f"{key} (Total)",
-            "start_date": g["start_date"],
-            "end_date": g["end_date"],
-            "duration_months": g["duration_months"],
-            "remaining_months": g["remaining_months"],
-            "profit_percentage": g["profit_percentage"],
-            "monthly_profit": g["monthly_profit"],
-            "balance": g["balance"],
+            "name": f"{group.name} (Total)",
+            "start_date": group.start_date,
+            "end_date": group.end_date,
+            "duration_months": group.duration_months,
+            "remaining_months": group.remaining_months,
+            "profit_percentage": group.profit_percentage,
+            "monthly_profit": group.monthly_profit,
+            "balance": group.balance,
         })
 
-    # Build Plotly bar chart (horizontal) using Python,
-    # aggregated by investor group total balance (respecting any filter).
-    bar_pairs = sorted(
-        ((g["name"], g["balance"]) for g in filtered_groups.values()),
-        key=lambda x: x[1] or 0,
-        reverse=True,
-    )
-    sorted_labels = [name for name, _ in bar_pairs]
-    sorted_balances = [bal for _, bal in bar_pairs]
-
-    bar_fig = go.Figure(
-        data=[
-            go.Bar(
-                x=sorted_balances,
-                y=sorted_labels,
-                orientation="h",
-                marker=dict(
-                    color="rgba(59, 130, 246, 0.85)",
-                    line=dict(color="rgba(37, 99, 235, 1)", width=1.2),
-                ),
-                hovertemplate="%{y}<br>Tk %{x:,.0f}<extra></extra>",
-            )
-        ]
-    )
-    bar_fig.update_layout(
-        height=420,
-        margin=dict(l=220, r=40, t=40, b=40),
-        xaxis=dict(
-            title="Balance Amount (Tk)",
-            tickprefix="Tk ",
-            separatethousands=True,
-            gridcolor="rgba(148, 163, 184, 0.3)",
-            zerolinecolor="rgba(148, 163, 184, 0.5)",
-        ),
-        yaxis=dict(automargin=True),
-        showlegend=False,
-        plot_bgcolor="#ffffff",
-        paper_bgcolor="#f9fafb",
-        title=dict(text="Investor's Investment Distribution", x=0.5),
-    )
-    bar_chart_json = json.dumps(bar_fig, cls=PlotlyJSONEncoder)
+    # Plotly bar chart of group total balances; the unfiltered one is
+    # prebuilt with the snapshot.
+    if search_query:
+        bar_chart_json = build_bar_chart_json(filtered_groups)
+    else:
+        bar_chart_json = snapshot.bar_chart_json
 
-    total_monthly_profit = db.session.query(func.sum(Investor.monthly_profit)).scalar() or 0
-    total_balance = db.session.query(func.sum(Investor.balance)).scalar() or 0
-    total_profit_payable_up_to_now = db.session.query(func.sum(Investor.profit_payable_up_to_now)).scalar() or 0
-    total_dividend_paid = db.session.query(func.sum(Investor.dividend_paid)).scalar() or 0
-    total_current_payable = db.session.query(func.sum(Investor.profit_due)).scalar() or 0
+    total_monthly_profit = totals["monthly_profit"]
+    total_balance = totals["balance"]
+    total_profit_payable_up_to_now = totals["profit_payable_up_to_now"]
+    total_dividend_paid = totals["dividend_paid"]
+    total_current_payable = totals["profit_due"]
 
     avg_profit_percentage = 0
     if groups:
-        sum_percentage = sum(g["profit_percentage"] or 0 for g in groups.values())
+        sum_percentage = sum(group.profit_percentage or 0 for group in groups)
         avg_profit_percentage = sum_percentage / len(groups)
 
     # Compute the custom Profit %:
@@ -905,394 +3040,113 @@ def home():
         total_current_payable=total_current_payable,
         avg_profit_percentage=avg_profit_percentage,
         computed_profit_percentage=computed_profit_percentage,
-        last_update_time=last_update_time,
+        last_update_time=snapshot.published_at,
         bar_chart_json=bar_chart_json,
         search_query=search_query,
     )
 
 
-@app.route('/sync')
-def sync():
-    update_database(force=True)
-    return redirect(url_for('home'))
-
-
-# Legacy summary (no longer exposed via a route)
-def investment_summary_legacy():
-    """
-    Summarize, per investor, how much principal we have received
-    (receipt-lines posted to 'Loans payable — Name'), how much
-    principal has been repaid (payment-lines to 'Loans payable — Name'),
-    how much profit has been paid (payment-lines to 'Profit payable' /
-    'Dividend payable'), and compare the computed principal balance
-    with the current Loans payable balance.
-    """
-    global summary_cache, summary_last_update
-
-    # Serve cached summary if it's still fresh and no explicit refresh is requested.
-    if summary_cache is not None and summary_last_update is not None:
-        age = (datetime.utcnow() - summary_last_update).total_seconds()
-        if age < UPDATE_INTERVAL_SECONDS and not request.args.get("refresh"):
-            return render_template(
-                "investment_summary.html",
-                investors=summary_cache["investors"],
-                totals=summary_cache["totals"],
-                format_currency=format_currency,
-            )
+SYNC_MAX_WAIT_SECONDS = 120  # upper bound for /sync?wait=N
 
-    accounts_data = fetch_special_accounts()
-    receipt_lines = fetch_receipt_lines()
-    payment_lines = fetch_payment_lines()
-    journal_lines = fetch_journal_entry_lines()
 
-    # Seed investors from Loans payable special accounts
-    summary = {}
-    for entry in accounts_data:
-        if entry.get("controlAccount") != "Loans payable":
-            continue
-        raw_name = entry.get("name", "")
-        if not raw_name:
-            continue
-        base_name = normalize_investor_name(raw_name)
-        current_balance = extract_balance_amount(entry)
-        info = summary.get(base_name)
-        if not info:
-            info = summary[base_name] = {
-                "name": base_name,
-                "current_balance": 0.0,
-                "total_received": 0.0,
-                "first_receipt_date": None,
-                "last_receipt_date": None,
-                "principal_repaid": 0.0,
-                "profit_paid": 0.0,
-            }
-        info["current_balance"] += current_balance
-
-    # Helper to ensure an investor entry exists even if there is
-    # a receipt/payment but no Loans payable account found.
-    def ensure_investor(raw_name: str):
-        base = normalize_investor_name(raw_name)
-        if base not in summary:
-            summary[base] = {
-                "name": base,
-                "current_balance": 0.0,
-                "total_received": 0.0,
-                "first_receipt_date": None,
-                "last_receipt_date": None,
-                "principal_repaid": 0.0,
-                "profit_paid": 0.0,
-            }
-        return summary[base]
-
-    # Aggregate receipts into Loans payable accounts
-    for line in receipt_lines:
-        if not isinstance(line, dict):
-            continue
-        account_str = (line.get("account") or "").strip()
-        investor_name = _parse_investor_name_from_account_v2(account_str, "Loans payable")
-        if not investor_name:
-            continue
-        amount = abs(line.get("amount", {}).get("value", 0))
-        info = ensure_investor(investor_name)
-        info["total_received"] += amount
-
-        date_str = line.get("date")
-        date_dt = parse_date(date_str) if date_str else None
-        if date_dt:
-            if not info["first_receipt_date"] or date_dt < info["first_receipt_date"]:
-                info["first_receipt_date"] = date_dt
-            if not info["last_receipt_date"] or date_dt > info["last_receipt_date"]:
-                info["last_receipt_date"] = date_dt
-
-    # Aggregate payments: principal repayments and profit payouts
-    for line in payment_lines:
-        if not isinstance(line, dict):
-            continue
-        account_str = (line.get("account") or "").strip()
-        amount = abs(line.get("amount", {}).get("value", 0))
-
-        # Principal repayments to Loans payable — Name
-        investor_name_lp = _parse_investor_name_from_account_v2(account_str, "Loans payable")
-        if investor_name_lp:
-            info = ensure_investor(investor_name_lp)
-            info["principal_repaid"] += amount
-            continue
+def published_sync_state() -> dict:
+    """Generation, publish time and last completed sync, shared by all processes."""
+    state = db.session.get(SyncState, SYNC_STATE_ID)
 
-        # Profit paid to Profit payable / Dividend payable — Name
-        investor_name_profit = (
-            _parse_investor_name_from_account_v2(account_str, "Profit payable")
-            or _parse_investor_name_from_account_v2(account_str, "Dividend payable")
-        )
-        if investor_name_profit:
-            info = ensure_investor(investor_name_profit)
-            info["profit_paid"] += amount
+    def iso(value):
+        return value.isoformat() + "Z" if value else None
 
-    # Finalize computed balance and match flag
-    for info in summary.values():
-        computed_balance = info["total_received"] - info["principal_repaid"]
-        info["computed_balance"] = computed_balance
-        current_balance = info["current_balance"] or 0.0
-        info["balance_match"] = abs(computed_balance - current_balance) < 0.01
+    return {
+        "generation": state.generation if state else 0,
+        "published_at": iso(state.published_at) if state else None,
+        "checked_at": iso(state.checked_at) if state else None,
+    }
 
-    # Sort investors alphabetically for display
-    investors_summary = sorted(summary.values(), key=lambda x: x["name"])
 
-    totals = {
-        "total_received": sum(i["total_received"] for i in investors_summary),
-        "principal_repaid": sum(i["principal_repaid"] for i in investors_summary),
-        "computed_balance": sum(i["computed_balance"] for i in investors_summary),
-        "current_balance": sum(i["current_balance"] for i in investors_summary),
-        "profit_paid": sum(i["profit_paid"] for i in investors_summary),
+@app.route('/sync', methods=['GET', 'POST'])
+def sync():
+    """
+    Queue a background sync, or attach to the one already in flight, and
+    return its job id (202 Accepted). With ?wait=N the request blocks up to
+    N seconds for the job and returns 200 with its result if it finished.
+
+    Jobs are tracked by the process that queued them, and other worker
+    processes answer their status URL with 404. The published sync state
+    returned here is shared, so clients can watch /sync/status for its
+    checked_at to change instead (within lease_seconds, the longest a
+    sync can run).
+    """
+    published = published_sync_state()
+    job, coalesced = trigger_sync("manual", full_resync=request.args.get("full") == "1")
+    wait_seconds = min(request.args.get("wait", 0, type=float), SYNC_MAX_WAIT_SECONDS)
+    if wait_seconds > 0:
+        job.wait(wait_seconds)
+    status_url = url_for('sync_status', job_id=job.id)
+    body = {
+        "job_id": job.id,
+        "status": job.status,
+        "coalesced": coalesced,
+        "status_url": status_url,
+        **published,
+        "lease_seconds": SYNC_LEASE_SECONDS,
     }
+    if job.finished:
+        body["report"] = job.report
+        return jsonify(body), 200
+    return jsonify(body), 202, {"Location": status_url}
 
-    summary_cache = {"investors": investors_summary, "totals": totals}
-    summary_last_update = datetime.utcnow()
 
-    return render_template(
-        "investment_summary.html",
-        investors=investors_summary,
-        totals=totals,
-        format_currency=format_currency,
-    )
+@app.route('/sync/status')
+@app.route('/sync/status/<job_id>')
+def sync_status(job_id=None):
+    """
+    Progress of a sync job (the most recent one when no id is given), and
+    the published sync state. A job queued by another worker process is
+    unknown here: 404, still with the sync state.
+    """
+    job = get_sync_job(job_id)
+    published = published_sync_state()
+    if job is None and job_id is not None:
+        return jsonify({"error": "unknown job", **published}), 404
+    snapshot = dashboard_snapshot_current
+    return jsonify({
+        "job": job.to_dict() if job else None,
+        **published,
+        "snapshot": {
+            "generation": snapshot.generation,
+            "investors": len(snapshot.investors),
+            "bytes": snapshot.size_bytes,
+        } if snapshot else None,
+    })
 
 
 @app.route('/investment_summary')
+@cached_view
 def investment_summary():
     """
     New grouped summary: one row per investor (base name) plus
-    per-phase/per-ledger detail rows.
+    per-phase/per-ledger detail rows, read from the summary tables
+    materialized by each sync (no Manager.io calls or aggregation per
+    request).
     """
     search_query = (request.args.get("q") or "").strip()
     search_lower = search_query.lower()
 
-    accounts_data = fetch_special_accounts()
-    receipt_lines = fetch_receipt_lines()
-    payment_lines = fetch_payment_lines()
-    journal_lines = fetch_journal_entry_lines()
-
-    groups = {}
-
-    def ensure_group_and_phase(
-        raw_name: str,
-        loans_balance_delta: float = 0.0,
-        profit_balance_delta: float = 0.0,
-    ):
-        base_name, phase_label, display_name = split_investor_variant(raw_name)
-        if not base_name:
-            return None, None
-
-        group = groups.get(base_name)
-        if not group:
-            group = groups[base_name] = {
-                "name": base_name,
-                "current_balance_loans": 0.0,
-                "current_balance_profit": 0.0,
-                "total_received": 0.0,
-                "principal_repaid": 0.0,
-                "profit_paid": 0.0,
-                "first_receipt_date": None,
-                "last_receipt_date": None,
-                "phases": {},
-            }
-        group["current_balance_loans"] += loans_balance_delta
-        group["current_balance_profit"] += profit_balance_delta
-
-        phases = group["phases"]
-        phase = phases.get(display_name)
-        if not phase:
-            phase = phases[display_name] = {
-                "name": display_name,
-                "phase": phase_label,
-                "current_balance_loans": 0.0,
-                "current_balance_profit": 0.0,
-                "total_received": 0.0,
-                "principal_repaid": 0.0,
-                "profit_paid": 0.0,
-                "first_receipt_date": None,
-                "last_receipt_date": None,
-            }
-        phase["current_balance_loans"] += loans_balance_delta
-        phase["current_balance_profit"] += profit_balance_delta
-        return group, phase
-
-    # Seed groups from Loans payable special accounts
-    for entry in accounts_data:
-        control = (entry.get("controlAccount") or "").strip().lower()
-        if control != "loans payable":
-            continue
-        raw_name = entry.get("name", "")
-        balance = extract_balance_amount(entry)
-        if not raw_name or balance == 0:
-            continue
-        ensure_group_and_phase(raw_name, loans_balance_delta=balance)
-
-    # Seed Profit payable balances (current liability) per investor/phase
-    profit_special_count = 0
-    for entry in accounts_data:
-        control = (entry.get("controlAccount") or "").strip().lower()
-        if control != "profit payable":
-            continue
-        raw_name = entry.get("name", "")
-        balance = extract_balance_amount(entry)
-        if not raw_name or balance == 0:
-            continue
-        ensure_group_and_phase(raw_name, profit_balance_delta=balance)
-        profit_special_count += 1
-
-    # If there are no Profit Payable special accounts, derive balances
-    # directly from journal-entry-lines (credit increases liability,
-    # debit reduces it).
-    if profit_special_count == 0:
-        for line in journal_lines:
-            if not isinstance(line, dict):
-                continue
-            account_str = (line.get("account") or "").strip()
-            investor_raw = _parse_investor_name_from_account_v2(account_str, "Profit payable")
-            if not investor_raw:
-                continue
-            debit = line.get("debit") or {}
-            credit = line.get("credit") or {}
-            debit_val = abs(debit.get("value", 0)) if isinstance(debit, dict) else 0
-            credit_val = abs(credit.get("value", 0)) if isinstance(credit, dict) else 0
-            delta = credit_val - debit_val
-            if delta:
-                ensure_group_and_phase(investor_raw, profit_balance_delta=delta)
-
-    # Aggregate receipts into Loans payable accounts
-    for line in receipt_lines:
-        if not isinstance(line, dict):
-            continue
-        account_str = (line.get("account") or "").strip()
-        investor_raw = _parse_investor_name_from_account_v2(account_str, "Loans payable")
-        if not investor_raw:
-            continue
-
-        amount = abs(line.get("amount", {}).get("value", 0))
-        group, phase = ensure_group_and_phase(investor_raw)
-        if not group or not phase:
-            continue
-
-        group["total_received"] += amount
-        phase["total_received"] += amount
-
-        date_str = line.get("date")
-        date_dt = parse_date(date_str) if date_str else None
-        if date_dt:
-            for target in (group, phase):
-                if not target["first_receipt_date"] or date_dt < target["first_receipt_date"]:
-                    target["first_receipt_date"] = date_dt
-                if not target["last_receipt_date"] or date_dt > target["last_receipt_date"]:
-                    target["last_receipt_date"] = date_dt
-
-    # Aggregate payments: principal repayments and profit payouts
-    for line in payment_lines:
-        if not isinstance(line, dict):
-            continue
-        account_str = (line.get("account") or "").strip()
-        amount = abs(line.get("amount", {}).get("value", 0))
-
-        inv_lp = _parse_investor_name_from_account_v2(account_str, "Loans payable")
-        inv_pp = (
-            _parse_investor_name_from_account_v2(account_str, "Profit payable")
-            or _parse_investor_name_from_account_v2(account_str, "Dividend payable")
-        )
-
-        if inv_lp:
-            group, phase = ensure_group_and_phase(inv_lp)
-            if not group or not phase:
-                continue
-            group["principal_repaid"] += amount
-            phase["principal_repaid"] += amount
-            continue
-
-        if inv_pp:
-            group, phase = ensure_group_and_phase(inv_pp)
-            if not group or not phase:
-                continue
-            group["profit_paid"] += amount
-            phase["profit_paid"] += amount
-
-    # Journal-entry-lines: Loans payable principal and Profit payable profit
-    for line in journal_lines:
-        if not isinstance(line, dict):
-            continue
-        account_str = (line.get("account") or "").strip()
-        debit = line.get("debit") or {}
-        credit = line.get("credit") or {}
-        debit_val = abs(debit.get("value", 0)) if isinstance(debit, dict) else 0
-        credit_val = abs(credit.get("value", 0)) if isinstance(credit, dict) else 0
-
-        inv_lp = _parse_investor_name_from_account_v2(account_str, "Loans payable")
-        inv_pp = (
-            _parse_investor_name_from_account_v2(account_str, "Profit payable")
-            or _parse_investor_name_from_account_v2(account_str, "Dividend payable")
-        )
-
-        # Loans payable: credit increases principal, debit reduces principal
-        if inv_lp:
-            group, phase = ensure_group_and_phase(inv_lp)
-            if not group or not phase:
-                continue
-            if credit_val:
-                group["total_received"] += credit_val
-                phase["total_received"] += credit_val
-            if debit_val:
-                group["principal_repaid"] += debit_val
-                phase["principal_repaid"] += debit_val
-            continue
-
-        # Profit payable: debit reduces liability, treat as profit paid
-        if inv_pp and debit_val:
-            group, phase = ensure_group_and_phase(inv_pp)
-            if not group or not phase:
-                continue
-            group["profit_paid"] += debit_val
-            phase["profit_paid"] += debit_val
-
-    # Finalize computed balances and match flags
-    group_list = []
-    for group in groups.values():
-        for phase in group["phases"].values():
-            # Principal side: Loans payable flows
-            phase["computed_balance"] = phase["total_received"] - phase["principal_repaid"]
-
-            # Profit payable balance per phase:
-            # - If we have Profit Payable special-accounts, their "balance"
-            #   already reflects all credits and debits (i.e., outstanding
-            #   profit payable), so use it as-is.
-            # - If not, we derive it from journal-entry-lines as net
-            #   credit minus debit, which is also already outstanding.
-            profit_phase_raw = phase.get("current_balance_profit") or 0.0
-            phase["current_balance_profit"] = profit_phase_raw
-
-        group["computed_balance"] = group["total_received"] - group["principal_repaid"]
-        loans_balance = group.get("current_balance_loans") or 0.0
-        group["balance_match"] = abs(group["computed_balance"] - loans_balance) < 0.01
-
-        # Profit payable balance per investor (group), same reasoning as above.
-        profit_group_raw = group.get("current_balance_profit") or 0.0
-        group["current_balance_profit"] = profit_group_raw
-
-        group["phases_list"] = sorted(group["phases"].values(), key=lambda p: p["name"])
-        group_list.append(group)
-
-    # Order summary groups by Loans payable current balance (largest to smallest)
-    group_list.sort(key=lambda g: (g.get("current_balance_loans") or 0), reverse=True)
+    # Materialized by the sync; phases are joined into the same query
+    groups_query = read_session().query(SummaryGroup).order_by(SummaryGroup.position)
 
     # Optional filter by investor base name
     if search_query:
-        group_list = [
-            g for g in group_list
-            if search_lower in (g["name"] or "").lower()
-        ]
+        groups_query = groups_query.filter(SummaryGroup.search_name.contains(search_lower, autoescape=True))
+    group_list = groups_query.all()
 
     totals = {
-        "total_received": sum(g["total_received"] for g in group_list),
-        "principal_repaid": sum(g["principal_repaid"] for g in group_list),
-        "computed_balance": sum(g["computed_balance"] for g in group_list),
-        "current_balance_loans": sum(g.get("current_balance_loans") or 0 for g in group_list),
-        "current_balance_profit": sum(g.get("current_balance_profit") or 0 for g in group_list),
-        "profit_paid": sum(g["profit_paid"] for g in group_list),
+        "total_received": sum(g.total_received for g in group_list),
+        "principal_repaid": sum(g.principal_repaid for g in group_list),
+        "computed_balance": sum(g.computed_balance for g in group_list),
+        "current_balance_loans": sum(g.current_balance_loans or 0 for g in group_list),
+        "current_balance_profit": sum(g.current_balance_profit or 0 for g in group_list),
+        "profit_paid": sum(g.profit_paid for g in group_list),
     }
 
     return render_template(
@@ -1314,27 +3168,27 @@ def journal():
 # Chart Data API Route
 # ---------------------------
 @app.route('/chart_data')
+@cached_view
 def chart_data():
     # Return investor GROUP names and their total balances
     # (same base-name grouping used on the dashboard),
     # with optional ?q=<name> filter.
     search_query = (request.args.get("q") or "").strip().lower()
-    raw_investors = Investor.query.order_by(Investor.name).all()
-    grouped = group_investors_for_dashboard(raw_investors)
+    grouped = sorted(dashboard_snapshot().groups, key=lambda g: g.name)
     if search_query:
-        grouped = [g for g in grouped if search_query in (g["name"] or "").lower()]
-    labels = [g["name"] for g in grouped]
-    balances = [g["balance"] for g in grouped]
+        grouped = [g for g in grouped if search_query in (g.name or "").lower()]
+    labels = [g.name for g in grouped]
+    balances = [g.balance for g in grouped]
     return jsonify({'labels': labels, 'balances': balances})
 
 # ---------------------------
 # Gantt Data API Route (for Investor Timeline)
 # ---------------------------
 @app.route('/gantt_data')
+@cached_view
 def gantt_data():
-    investors = Investor.query.all()
     rows = []
-    for inv in investors:
+    for inv in dashboard_snapshot().investors:
         if inv.start_date and inv.end_date:
             rows.append({
                 'investor': inv.name,
@@ -0,0 +1,71 @@
+"""
+Benchmark for the profit accrual step of a sync.
+
+Builds a synthetic investor book and computes term / profit figures with the
+per-investor helpers and with the vectorized accrue_profit() pass, checks that
+both give exactly the same values, and reports the time of each.
+
+Usage: python bench_accrual.py [--investors 100000] [--repeat 5]
+"""
+import argparse
+import random
+import time
+from datetime import datetime, timedelta
+
+import app
+
+
+def make_book(count):
+    today = datetime.today()
+    balances, percentages, starts, ends = [], [], [], []
+    for _ in range(count):
+        start = today - timedelta(days=random.randint(-90, 2000)) if random.random() > 0.02 else None
+        end = start + timedelta(days=random.randint(30, 1800)) if start and random.random() > 0.02 else None
+        balances.append(random.choice((random.randint(1, 500) * 10000, round(random.uniform(0, 5e6), 2))))
+        percentages.append(random.choice((0, 12, 15, 18, 16.5, round(random.uniform(0, 30), 3))))
+        starts.append(start)
+        ends.append(end)
+    paid = [round(random.uniform(0, 2e5), 2) if random.random() > 0.3 else 0 for _ in range(count)]
+    return balances, percentages, starts, ends, paid
+
+
+def timed(repeat, func):
+    best, result = None, None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - started
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000, result
+
+
+def compute(book):
+    balances, percentages, starts, ends, paid = book
+    accruals = app.accrue_profit(balances, percentages, starts, ends)
+    due = app.accrue_profit_due([a.profit_payable_up_to_now for a in accruals], paid)
+    return accruals, due
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--investors", type=int, default=100000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    if app.np is None:
+        raise SystemExit("numpy is not installed; only the scalar path is available.")
+
+    book = make_book(args.investors)
+
+    app.PROFIT_ACCRUAL_VECTORIZED = False
+    scalar_ms, scalar = timed(args.repeat, lambda: compute(book))
+    app.PROFIT_ACCRUAL_VECTORIZED = True
+    vector_ms, vector = timed(args.repeat, lambda: compute(book))
+
+    mismatches = sum(a != b for a, b in zip(scalar[0], vector[0])) + sum(a != b for a, b in zip(scalar[1], vector[1]))
+    print(
+        f"{args.investors} investors: scalar {scalar_ms:.1f} ms, vectorized {vector_ms:.1f} ms "
+        f"({scalar_ms / vector_ms:.1f}x), {mismatches} mismatches"
+    )
+    if mismatches:
+        raise SystemExit(1)
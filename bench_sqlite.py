@@ -0,0 +1,113 @@
+"""
+Concurrent read/write benchmark for the SQLite connection profiles.
+
+A writer process repeatedly replaces a ledger-sized table in one big
+transaction (like a full sync), while reader threads run the summary-style
+GROUP BY query. Reports read latency and failed reads per profile.
+
+Usage: python bench_sqlite.py [--rows 50000] [--seconds 10] [--readers 4] [--profile tuned]
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import sqlite3
+import statistics
+import tempfile
+import threading
+import time
+
+from app import SQLITE_PROFILES
+
+
+def connect(path, profile, query_only=False):
+    conn = sqlite3.connect(path, timeout=30, isolation_level=None)
+    for pragma in SQLITE_PROFILES[profile]:
+        conn.execute(pragma)
+    if query_only:
+        conn.execute("PRAGMA query_only=ON")
+    return conn
+
+
+def make_rows(count):
+    return [
+        (f"Investor {i % 500:03d}", random.choice(("receipt", "payment", "journal")), random.random() * 1000)
+        for i in range(count)
+    ]
+
+
+def writer(path, profile, rows, stop_at, result):
+    conn = connect(path, profile)
+    data = make_rows(rows)
+    writes = 0
+    while time.time() < stop_at:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("DELETE FROM ledger_line")
+        conn.executemany("INSERT INTO ledger_line (base_name, source, amount) VALUES (?, ?, ?)", data)
+        conn.execute("COMMIT")
+        writes += 1
+    result.value = writes
+
+
+def reader(path, profile, stop_at, latencies, errors):
+    conn = connect(path, profile, query_only=True)
+    while time.time() < stop_at:
+        started = time.perf_counter()
+        try:
+            conn.execute(
+                "SELECT base_name, source, SUM(amount) FROM ledger_line GROUP BY base_name, source"
+            ).fetchall()
+        except sqlite3.OperationalError:
+            errors.append(1)
+            continue
+        latencies.append((time.perf_counter() - started) * 1000)
+
+
+def run(profile, rows, seconds, readers):
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bench.db")
+        conn = connect(path, profile)
+        conn.execute(
+            "CREATE TABLE ledger_line (id INTEGER PRIMARY KEY, base_name TEXT, source TEXT, amount REAL)"
+        )
+        conn.executemany(
+            "INSERT INTO ledger_line (base_name, source, amount) VALUES (?, ?, ?)", make_rows(rows)
+        )
+        conn.close()
+
+        stop_at = time.time() + seconds
+        writes = multiprocessing.Value("i", 0)
+        write_proc = multiprocessing.Process(target=writer, args=(path, profile, rows, stop_at, writes))
+        write_proc.start()
+
+        latencies, errors = [], []
+        threads = [
+            threading.Thread(target=reader, args=(path, profile, stop_at, latencies, errors))
+            for _ in range(readers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        write_proc.join()
+
+    latencies.sort()
+    p99 = latencies[int(len(latencies) * 0.99)] if latencies else 0
+    print(
+        f"{profile:>8}: {len(latencies)} reads, {len(errors)} failed, "
+        f"p50 {statistics.median(latencies) if latencies else 0:.1f} ms, "
+        f"p99 {p99:.1f} ms, max {latencies[-1] if latencies else 0:.1f} ms, "
+        f"{writes.value} full rewrites"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50000)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--profile", choices=sorted(SQLITE_PROFILES), action="append")
+    args = parser.parse_args()
+
+    for name in args.profile or sorted(SQLITE_PROFILES):
+        run(name, args.rows, args.seconds, args.readers)
@@ -26,9 +26,123 @@ MANAGER_API_KEY = (
 # HTTP timeout for Manager.io API calls (seconds)
 API_TIMEOUT_SECONDS = int(os.environ.get("MANAGER_API_TIMEOUT_SECONDS", "10"))
 
+# Per-endpoint overrides for the HTTP timeout (seconds). Large list
+# endpoints can be given more time than the per-account form lookups.
+API_ENDPOINT_TIMEOUTS = {
+    "special-accounts": float(
+        os.environ.get("MANAGER_API_TIMEOUT_SPECIAL_ACCOUNTS", API_TIMEOUT_SECONDS)
+    ),
+    "special-account-form": float(
+        os.environ.get("MANAGER_API_TIMEOUT_SPECIAL_ACCOUNT_FORM", API_TIMEOUT_SECONDS)
+    ),
+    "receipt-lines": float(
+        os.environ.get("MANAGER_API_TIMEOUT_RECEIPT_LINES", API_TIMEOUT_SECONDS)
+    ),
+    "payment-lines": float(
+        os.environ.get("MANAGER_API_TIMEOUT_PAYMENT_LINES", API_TIMEOUT_SECONDS)
+    ),
+    "journal-entry-lines": float(
+        os.environ.get("MANAGER_API_TIMEOUT_JOURNAL_ENTRY_LINES", API_TIMEOUT_SECONDS)
+    ),
+}
+
+# Retries for transient Manager.io failures (connection errors, HTTP 429/5xx).
+# Delays grow exponentially from the base with full jitter, capped at the max.
+API_MAX_RETRIES = int(os.environ.get("MANAGER_API_MAX_RETRIES", "3"))
+API_BACKOFF_BASE_SECONDS = float(os.environ.get("MANAGER_API_BACKOFF_BASE_SECONDS", "0.5"))
+API_BACKOFF_MAX_SECONDS = float(os.environ.get("MANAGER_API_BACKOFF_MAX_SECONDS", "8"))
+
+# Page size used when walking list endpoints (receipt-lines, payment-lines, ...)
+# with skip/pageSize, and whether to prefetch the next page while the current
+# one is being processed.
+API_PAGE_SIZE = int(os.environ.get("MANAGER_API_PAGE_SIZE", "1000"))
+API_PREFETCH_NEXT_PAGE = os.environ.get("MANAGER_API_PREFETCH_NEXT_PAGE", "1") == "1"
+
+# Stream receipt/payment/journal lines into the aggregation loops instead of
+# materialising each collection as a list first. Lowers peak memory on large
+# ledgers at the cost of fetching the line collections one after another.
+# Uses the optional `ijson` package (when installed) to parse each page
+# incrementally straight from the socket.
+API_STREAM_LEDGER_LINES = os.environ.get("MANAGER_API_STREAM_LEDGER_LINES", "0") == "1"
+
+# Size of the keep-alive connection pool shared by all Manager.io requests
+API_POOL_SIZE = int(os.environ.get("MANAGER_API_POOL_SIZE", "16"))
+
+# Maximum number of concurrent special-account-form lookups during a sync
+DETAIL_FETCH_CONCURRENCY = int(os.environ.get("MANAGER_DETAIL_FETCH_CONCURRENCY", "8"))
+
+# Number of distinct ledger account strings whose classification (investor
+# account kind and parsed investor name) is memoised during a sync.
+LEDGER_CLASSIFIER_CACHE_SIZE = int(os.environ.get("INVESTOR_LEDGER_CLASSIFIER_CACHE_SIZE", "4096"))
+
+# Compute monthly profit / elapsed months / payable for all investors in one
+# vectorized pass when the optional `numpy` package is installed. Results are
+# identical to the per-investor path, which is used otherwise.
+PROFIT_ACCRUAL_VECTORIZED = os.environ.get("INVESTOR_VECTORIZED_ACCRUAL", "1") == "1"
+
 # Minimum interval between automatic syncs (seconds)
 UPDATE_INTERVAL_SECONDS = int(os.environ.get("INVESTOR_UPDATE_INTERVAL_SECONDS", "300"))
 
+# Background sync scheduler: refresh every UPDATE_INTERVAL_SECONDS plus a
+# random delay of up to SYNC_JITTER_SECONDS, so several app instances do not
+# all hit Manager.io at the same moment. With the scheduler disabled, syncs
+# only run when triggered via /sync (still in the background).
+SYNC_SCHEDULER_ENABLED = os.environ.get("INVESTOR_SYNC_SCHEDULER", "1") == "1"
+SYNC_JITTER_SECONDS = float(os.environ.get("INVESTOR_SYNC_JITTER_SECONDS", "30"))
+
+# Sync triggers are coalesced: a /sync that arrives while a sync is queued or
+# running attaches to that job, and one arriving within SYNC_DEBOUNCE_SECONDS
+# of a finished sync gets that sync's result instead of starting a new one.
+SYNC_DEBOUNCE_SECONDS = float(os.environ.get("INVESTOR_SYNC_DEBOUNCE_SECONDS", "10"))
+
+# With several app processes (e.g. gunicorn workers) only the process holding
+# the sync lease in the database runs a sync; the others skip. The lease is
+# renewed as the sync progresses and expires after SYNC_LEASE_SECONDS if its
+# holder dies mid-sync.
+SYNC_LEASE_SECONDS = int(os.environ.get("INVESTOR_SYNC_LEASE_SECONDS", "900"))
+
+# Delta sync: after the first full download, only fetch receipt/payment/journal
+# lines added since the last sync (tracked by a per-collection watermark).
+# A full resync still runs every FULL_RESYNC_INTERVAL_SECONDS, or on demand
+# via /sync?full=1.
+DELTA_SYNC_ENABLED = os.environ.get("INVESTOR_DELTA_SYNC", "1") == "1"
+FULL_RESYNC_INTERVAL_SECONDS = int(os.environ.get("INVESTOR_FULL_RESYNC_INTERVAL_SECONDS", "86400"))
+
+# SQLite connection profile. "tuned" switches the database to WAL journaling
+# (readers are no longer blocked while a sync writes), relaxes fsyncs to
+# synchronous=NORMAL, applies the busy timeout / mmap / page cache sizes below
+# on every connection, and gives request handlers their own query-only
+# connection pool. "default" keeps SQLite's stock settings.
+SQLITE_PROFILE = os.environ.get("IMS_SQLITE_PROFILE", "tuned")
+SQLITE_BUSY_TIMEOUT_MS = int(os.environ.get("IMS_SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_MMAP_SIZE = int(os.environ.get("IMS_SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_CACHE_SIZE_KB = int(os.environ.get("IMS_SQLITE_CACHE_SIZE_KB", "65536"))
+SQLITE_READ_POOL_SIZE = int(os.environ.get("IMS_SQLITE_READ_POOL_SIZE", "8"))
+
+# Cache for computed views (dashboard, investment summary, chart and gantt
+# data), keyed on the published sync generation so each sync invalidates it
+# at once. "sqlite" keeps one cache file shared by all app processes (and
+# across restarts), "memory" a cache per process, "none" disables it. At most
+# RESULT_CACHE_MAX_ENTRIES results are kept; the least recently used go first.
+# A hit on the "sqlite" cache only records its use when the last recorded use
+# is at least RESULT_CACHE_TOUCH_SECONDS old, so most hits are plain reads.
+RESULT_CACHE_BACKEND = os.environ.get("IMS_RESULT_CACHE", "sqlite")
+RESULT_CACHE_PATH = os.environ.get("IMS_RESULT_CACHE_PATH")  # default: instance/result_cache.db
+RESULT_CACHE_MAX_ENTRIES = int(os.environ.get("IMS_RESULT_CACHE_MAX_ENTRIES", "256"))
+RESULT_CACHE_TOUCH_SECONDS = float(os.environ.get("IMS_RESULT_CACHE_TOUCH_SECONDS", "60"))
+
+# Version of the deployed code, part of every cached view key and ETag so a
+# deploy invalidates pages rendered by the previous code. Defaults to a hash
+# of app.py, config.py and the templates, computed at startup.
+BUILD_VERSION = os.environ.get("IMS_BUILD_VERSION")
+
+# Compress HTML and JSON responses of at least COMPRESS_MIN_BYTES with gzip,
+# or with brotli when the optional `brotli` package is installed and the
+# browser accepts it. Compressed dashboard views are kept in the result cache
+# so each one is compressed once per sync generation.
+COMPRESSION_ENABLED = os.environ.get("IMS_COMPRESSION", "1") == "1"
+COMPRESS_MIN_BYTES = int(os.environ.get("IMS_COMPRESS_MIN_BYTES", "1024"))
+
 # Custom field IDs for investor terms (Start Date, End Date, Profit %)
 # These can be overridden via env vars per tenant.
 FIELD_IDS = {
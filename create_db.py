@@ -1,7 +1,11 @@
+from flask_migrate import stamp
+
 from app import app, db
 
 # Ensure the Flask app context is set
 with app.app_context():
     db.create_all()
+    # The new schema is already current: record that, so later
+    # `flask db upgrade` runs only apply newer migrations.
+    stamp()
     print("Database created successfully!")
-
@@ -0,0 +1,29 @@
+"""Add sync_state generation pointer
+
+Revision ID: 1f7c3a9b5d20
+Revises: c5a9e2f41b6d
+Create Date: 2026-10-16 13:02:41.518203
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1f7c3a9b5d20'
+down_revision = 'c5a9e2f41b6d'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('sync_state',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('generation', sa.Integer(), nullable=False),
+    sa.Column('published_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('sync_state')
@@ -0,0 +1,59 @@
+"""Add local ledger store (ledger_account, ledger_line)
+
+Revision ID: 3b8f2c1d9a47
+Revises: 69fea7f47ca5
+Create Date: 2026-10-16 09:12:41.118302
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3b8f2c1d9a47'
+down_revision = '69fea7f47ca5'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('ledger_account',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('control_account', sa.String(length=50), nullable=False),
+    sa.Column('name', sa.String(length=200), nullable=False),
+    sa.Column('base_name', sa.String(length=200), nullable=False),
+    sa.Column('phase_label', sa.String(length=100), nullable=False),
+    sa.Column('display_name', sa.String(length=200), nullable=False),
+    sa.Column('balance', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('ledger_account', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_ledger_account_base_name'), ['base_name'], unique=False)
+
+    op.create_table('ledger_line',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('source', sa.String(length=10), nullable=False),
+    sa.Column('account_kind', sa.String(length=10), nullable=False),
+    sa.Column('investor_name', sa.String(length=200), nullable=False),
+    sa.Column('base_name', sa.String(length=200), nullable=False),
+    sa.Column('phase_label', sa.String(length=100), nullable=False),
+    sa.Column('display_name', sa.String(length=200), nullable=False),
+    sa.Column('date', sa.String(length=10), nullable=True),
+    sa.Column('amount', sa.Float(), nullable=False),
+    sa.Column('debit', sa.Float(), nullable=False),
+    sa.Column('credit', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('ledger_line', schema=None) as batch_op:
+        batch_op.create_index('ix_ledger_line_investor', ['base_name', 'phase_label', 'date'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('ledger_line', schema=None) as batch_op:
+        batch_op.drop_index('ix_ledger_line_investor')
+
+    op.drop_table('ledger_line')
+    with op.batch_alter_table('ledger_account', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_ledger_account_base_name'))
+
+    op.drop_table('ledger_account')
@@ -0,0 +1,28 @@
+"""Add sync lease columns to sync_state
+
+Revision ID: 6a2d8e4c1b93
+Revises: 1f7c3a9b5d20
+Create Date: 2026-10-16 13:41:09.207615
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6a2d8e4c1b93'
+down_revision = '1f7c3a9b5d20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('sync_state', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('lease_holder', sa.String(length=128), nullable=True))
+        batch_op.add_column(sa.Column('lease_expires_at', sa.DateTime(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('sync_state', schema=None) as batch_op:
+        batch_op.drop_column('lease_expires_at')
+        batch_op.drop_column('lease_holder')
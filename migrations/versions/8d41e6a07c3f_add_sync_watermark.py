@@ -0,0 +1,32 @@
+"""Add sync_watermark for delta syncs
+
+Revision ID: 8d41e6a07c3f
+Revises: 3b8f2c1d9a47
+Create Date: 2026-10-16 11:03:18.642907
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8d41e6a07c3f'
+down_revision = '3b8f2c1d9a47'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('sync_watermark',
+    sa.Column('source', sa.String(length=10), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('last_key', sa.String(length=64), nullable=True),
+    sa.Column('last_date', sa.String(length=10), nullable=True),
+    sa.Column('full_synced_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('source')
+    )
+
+
+def downgrade():
+    op.drop_table('sync_watermark')
@@ -0,0 +1,70 @@
+"""Add investor.base_name for SQL dashboard grouping
+
+Revision ID: 9e3b5f7a2c18
+Revises: 6a2d8e4c1b93
+Create Date: 2026-10-16 14:20:37.845512
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9e3b5f7a2c18'
+down_revision = '6a2d8e4c1b93'
+branch_labels = None
+depends_on = None
+
+
+# Frozen copy of the investor name parsing in app.py as of this revision,
+# so the backfill does not import (or depend on later versions of) the app.
+def _split_investor_variant(raw_name):
+    """(base_name, phase_label, display_name) of a raw investor account name."""
+    if not raw_name:
+        return "", "", ""
+
+    display = raw_name.strip()
+    # Drop leading code like "9995 - "
+    if " - " in display:
+        display = display.split(" - ", 1)[1].strip()
+
+    # Phase label from trailing parentheses, if present
+    phase_label = "Base"
+    idx = display.rfind("(")
+    if idx != -1 and display.endswith(")"):
+        phase_label = display[idx + 1 : -1].strip() or "Base"
+        base = display[:idx].strip()
+    else:
+        base = display
+
+    # Normalize: strip any remaining " (...)" suffix
+    base_name = base.strip()
+    idx = base_name.find(" (")
+    if idx != -1:
+        base_name = base_name[:idx].strip()
+    return base_name, phase_label, display
+
+
+def _investor_group_key(raw_name):
+    base_name, _, _ = _split_investor_variant(raw_name)
+    return base_name or raw_name or "Unknown"
+
+
+def upgrade():
+    with op.batch_alter_table('investor', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('base_name', sa.String(length=200), nullable=True))
+        batch_op.create_index(batch_op.f('ix_investor_base_name'), ['base_name'], unique=False)
+
+    # Backfill existing rows; later syncs keep the column up to date.
+    investor = sa.table('investor', sa.column('id', sa.Integer), sa.column('name', sa.String), sa.column('base_name', sa.String))
+    conn = op.get_bind()
+    for row in conn.execute(sa.select(investor.c.id, investor.c.name)).all():
+        conn.execute(
+            investor.update().where(investor.c.id == row.id).values(base_name=_investor_group_key(row.name))
+        )
+
+
+def downgrade():
+    with op.batch_alter_table('investor', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_investor_base_name'))
+        batch_op.drop_column('base_name')
@@ -0,0 +1,43 @@
+"""Add ledger_line_staging table
+
+Revision ID: a4f1c7e9d2b6
+Revises: e3c6a1f8b2d4
+Create Date: 2026-10-16 17:05:31.642810
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a4f1c7e9d2b6'
+down_revision = 'e3c6a1f8b2d4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('ledger_line_staging',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('sync_id', sa.String(length=32), nullable=False),
+    sa.Column('source', sa.String(length=10), nullable=False),
+    sa.Column('account_kind', sa.String(length=10), nullable=False),
+    sa.Column('investor_name', sa.String(length=200), nullable=False),
+    sa.Column('base_name', sa.String(length=200), nullable=False),
+    sa.Column('phase_label', sa.String(length=100), nullable=False),
+    sa.Column('display_name', sa.String(length=200), nullable=False),
+    sa.Column('date', sa.String(length=10), nullable=True),
+    sa.Column('amount', sa.Float(), nullable=False),
+    sa.Column('debit', sa.Float(), nullable=False),
+    sa.Column('credit', sa.Float(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('ledger_line_staging', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_ledger_line_staging_sync_id'), ['sync_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('ledger_line_staging', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_ledger_line_staging_sync_id'))
+
+    op.drop_table('ledger_line_staging')
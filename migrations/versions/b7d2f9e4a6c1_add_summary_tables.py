@@ -0,0 +1,71 @@
+"""Add materialized investment summary tables
+
+Revision ID: b7d2f9e4a6c1
+Revises: 9e3b5f7a2c18
+Create Date: 2026-10-16 15:36:50.271946
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'b7d2f9e4a6c1'
+down_revision = '9e3b5f7a2c18'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('summary_group',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=200), nullable=False),
+    sa.Column('search_name', sa.String(length=200), nullable=False),
+    sa.Column('current_balance_loans', sa.Float(), nullable=False),
+    sa.Column('current_balance_profit', sa.Float(), nullable=False),
+    sa.Column('total_received', sa.Float(), nullable=False),
+    sa.Column('principal_repaid', sa.Float(), nullable=False),
+    sa.Column('profit_paid', sa.Float(), nullable=False),
+    sa.Column('computed_balance', sa.Float(), nullable=False),
+    sa.Column('balance_match', sa.Boolean(), nullable=False),
+    sa.Column('first_receipt_date', sa.String(length=10), nullable=True),
+    sa.Column('last_receipt_date', sa.String(length=10), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('name')
+    )
+    with op.batch_alter_table('summary_group', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_summary_group_position'), ['position'], unique=False)
+        batch_op.create_index(batch_op.f('ix_summary_group_search_name'), ['search_name'], unique=False)
+
+    op.create_table('summary_phase',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('group_id', sa.Integer(), nullable=False),
+    sa.Column('position', sa.Integer(), nullable=False),
+    sa.Column('name', sa.String(length=200), nullable=False),
+    sa.Column('phase_label', sa.String(length=100), nullable=True),
+    sa.Column('current_balance_loans', sa.Float(), nullable=False),
+    sa.Column('current_balance_profit', sa.Float(), nullable=False),
+    sa.Column('total_received', sa.Float(), nullable=False),
+    sa.Column('principal_repaid', sa.Float(), nullable=False),
+    sa.Column('profit_paid', sa.Float(), nullable=False),
+    sa.Column('computed_balance', sa.Float(), nullable=False),
+    sa.Column('first_receipt_date', sa.String(length=10), nullable=True),
+    sa.Column('last_receipt_date', sa.String(length=10), nullable=True),
+    sa.ForeignKeyConstraint(['group_id'], ['summary_group.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('summary_phase', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_summary_phase_group_id'), ['group_id'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('summary_phase', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_summary_phase_group_id'))
+
+    op.drop_table('summary_phase')
+    with op.batch_alter_table('summary_group', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_summary_group_search_name'))
+        batch_op.drop_index(batch_op.f('ix_summary_group_position'))
+
+    op.drop_table('summary_group')
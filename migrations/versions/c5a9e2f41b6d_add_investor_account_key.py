@@ -0,0 +1,28 @@
+"""Add investor.account_key for upsert-based sync
+
+Revision ID: c5a9e2f41b6d
+Revises: 8d41e6a07c3f
+Create Date: 2026-10-16 12:27:05.390114
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c5a9e2f41b6d'
+down_revision = '8d41e6a07c3f'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('investor', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('account_key', sa.String(length=64), nullable=True))
+        batch_op.create_index(batch_op.f('ix_investor_account_key'), ['account_key'], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('investor', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_investor_account_key'))
+        batch_op.drop_column('account_key')
@@ -0,0 +1,29 @@
+"""Add checked_at to sync_state
+
+Revision ID: d8e5b2a7f4c9
+Revises: a4f1c7e9d2b6
+Create Date: 2026-10-16 22:41:07.318264
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd8e5b2a7f4c9'
+down_revision = 'a4f1c7e9d2b6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('sync_state', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('checked_at', sa.DateTime(), nullable=True))
+
+    # Until now every sync published, so the last check was the last publish.
+    op.execute("UPDATE sync_state SET checked_at = published_at")
+
+
+def downgrade():
+    with op.batch_alter_table('sync_state', schema=None) as batch_op:
+        batch_op.drop_column('checked_at')
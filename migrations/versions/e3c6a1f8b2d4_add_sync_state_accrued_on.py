@@ -0,0 +1,26 @@
+"""Add accrued_on to sync_state
+
+Revision ID: e3c6a1f8b2d4
+Revises: b7d2f9e4a6c1
+Create Date: 2026-10-16 16:12:44.583120
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e3c6a1f8b2d4'
+down_revision = 'b7d2f9e4a6c1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('sync_state', schema=None) as batch_op:
+        batch_op.add_column(sa.Column('accrued_on', sa.Date(), nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table('sync_state', schema=None) as batch_op:
+        batch_op.drop_column('accrued_on')
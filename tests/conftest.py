@@ -0,0 +1,39 @@
+import os
+
+# Keep tests off the shared result cache file and the sync scheduler thread
+os.environ.setdefault("IMS_RESULT_CACHE", "none")
+os.environ.setdefault("INVESTOR_SYNC_SCHEDULER", "0")
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import scoped_session, sessionmaker
+
+import app
+from app import db
+
+
+@pytest.fixture
+def session():
+    """
+    A scoped session (like db.session, which tests may replace with it) on
+    a fresh in-memory database with every app table.
+    """
+    engine = create_engine("sqlite://")
+    db.metadata.create_all(engine)
+    session = scoped_session(sessionmaker(bind=engine))
+    yield session
+    session.remove()
+    engine.dispose()
+
+
+@pytest.fixture
+def client(session, monkeypatch):
+    """A logged-in test client reading and writing `session`, without background syncs."""
+    monkeypatch.setattr(app.db, "session", session)
+    monkeypatch.setattr(app, "ReadSession", None)
+    monkeypatch.setattr(app, "sync_worker", object())
+    monkeypatch.setattr(app, "ADMIN_PASSWORD", "secret")
+    client = app.app.test_client()
+    with client.session_transaction() as flask_session:
+        flask_session["logged_in"] = True
+    return client
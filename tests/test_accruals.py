@@ -0,0 +1,40 @@
+from datetime import date
+
+import app
+from app import Investor, SyncState, SYNC_STATE_ID, iso_date, ledger_line_row
+
+
+def test_iso_date_pads_dates_parse_date_accepts():
+    assert iso_date("2024-1-5") == "2024-01-05"
+    assert iso_date("2024-01-05") == "2024-01-05"
+    assert iso_date("2024-02-30") is None
+    assert iso_date("") is None
+
+
+def test_ledger_line_dates_are_stored_zero_padded():
+    row = ledger_line_row("receipt", {
+        "account": "Loans payable - 1 - Real Person",
+        "amount": {"value": 1000},
+        "date": "2024-1-5T00:00:00",
+    })
+    assert row["date"] == "2024-01-05"
+
+
+def test_refresh_accruals_reads_dates_from_non_padded_input(session, monkeypatch):
+    monkeypatch.setattr(app.db, "session", session)
+    session.add(SyncState(id=SYNC_STATE_ID, generation=1, accrued_on=date(2024, 1, 1)))
+    session.add(Investor(
+        name="1 - Real Person",
+        start_date=iso_date("2024-1-5") or "2024-1-5",
+        end_date=iso_date("2025-1-5") or "2025-1-5",
+        balance=120000,
+        monthly_profit=1000,
+        dividend_paid=500,
+    ))
+    session.commit()
+
+    assert app.refresh_accruals(date(2024, 6, 15)) == 1
+    investor = session.query(Investor).one()
+    assert investor.remaining_months == 7
+    assert investor.profit_payable_up_to_now == 5000
+    assert investor.profit_due == 4500
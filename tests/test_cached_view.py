@@ -0,0 +1,23 @@
+from datetime import datetime
+
+import app
+from app import MemoryResultCache, SyncState, SYNC_STATE_ID
+
+
+def test_a_new_code_version_does_not_serve_or_confirm_old_pages(client, session, monkeypatch):
+    monkeypatch.setattr(app, "result_cache", MemoryResultCache(8))
+    session.add(SyncState(id=SYNC_STATE_ID, generation=1, published_at=datetime(2026, 1, 1)))
+    session.commit()
+
+    first = client.get("/investment_summary")
+    etag = first.headers["ETag"]
+    assert client.get("/investment_summary", headers={"If-None-Match": etag}).status_code == 304
+
+    monkeypatch.setattr(app, "CODE_VERSION", "next-deploy")
+    rendered = []
+    monkeypatch.setattr(app, "render_template", lambda *args, **kwargs: rendered.append(args) or "new page")
+    deployed = client.get("/investment_summary", headers={"If-None-Match": etag})
+
+    assert deployed.status_code == 200
+    assert deployed.headers["ETag"] != etag
+    assert deployed.get_data(as_text=True) == "new page" and rendered
@@ -0,0 +1,71 @@
+from sqlalchemy import event
+
+import app
+from app import LedgerAggregates, LedgerLine, SummaryGroup, build_investment_summary_groups, ledger_line_row
+
+
+def add_lines(session, *lines):
+    for source, line in lines:
+        session.add(LedgerLine(**ledger_line_row(source, line)))
+    session.commit()
+
+
+def receipt(account, value, date="2024-01-05"):
+    return "receipt", {"account": account, "amount": {"value": value}, "date": date}
+
+
+def summary_names(session):
+    groups = build_investment_summary_groups(LedgerAggregates(session))
+    return {group["name"]: [phase["name"] for phase in group["phases_list"]] for group in groups}
+
+
+def test_receipt_to_loans_payable_creates_group(session):
+    add_lines(session, receipt("Loans payable - 1 - Real Person", 1000))
+    assert summary_names(session) == {"Real Person": ["Real Person"]}
+
+
+def test_receipt_to_profit_payable_alone_creates_no_group(session):
+    add_lines(
+        session,
+        receipt("Loans payable - 1 - Real Person", 1000),
+        receipt("Profit payable - 1 - Ghost Person", 50),
+        receipt("Dividend payable - 1 - Ghost Person (P2)", 50),
+    )
+    assert summary_names(session) == {"Real Person": ["Real Person"]}
+
+
+def summary_group(name, phases):
+    figures = dict.fromkeys(app.SUMMARY_FIELDS, 0.0)
+    return {
+        "name": name,
+        "balance_match": True,
+        **figures,
+        "phases_list": [{"name": phase, "phase": "Base", **figures} for phase in phases],
+    }
+
+
+def test_summary_groups_never_reuse_ids_and_load_with_their_phases(session, monkeypatch):
+    monkeypatch.setattr(app.db, "session", session)
+    app.write_summary_tables([summary_group("Alice", ["Alice"]), summary_group("Bob", ["Bob (P2)"])])
+    first_ids = {group.id for group in session.query(SummaryGroup)}
+    app.write_summary_tables([summary_group("Bob", ["Bob (P2)"]), summary_group("Alice", ["Alice"])])
+    session.commit()
+
+    statements = []
+    engine = session.get_bind()
+
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        groups = session.query(SummaryGroup).order_by(SummaryGroup.position).all()
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+    assert first_ids.isdisjoint(group.id for group in groups)
+    assert [(group.name, [phase.name for phase in group.phases_list]) for group in groups] == [
+        ("Bob", ["Bob (P2)"]),
+        ("Alice", ["Alice"]),
+    ]
+    assert len(statements) == 1
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+import app
+from app import ManagerClient
+
+RECORDS = [{"line": index} for index in range(5)]
+
+
+class CappedPageResponse:
+    """A list-endpoint page from a server that sends at most 2 records per page."""
+
+    status_code = 200
+    text = ""
+
+    def __init__(self, params, with_total):
+        skip = params["skip"]
+        body = {"receiptLines": RECORDS[skip:skip + min(params["pageSize"], 2)]}
+        if with_total:
+            body["totalRecords"] = len(RECORDS)
+        self.body = json.dumps(body).encode("utf-8")
+
+    def json(self):
+        return json.loads(self.body)
+
+    def iter_content(self, chunk_size):
+        yield self.body
+
+    def close(self):
+        pass
+
+
+def capped_client(monkeypatch, with_total):
+    client = ManagerClient("https://manager.example/api2", headers={}, default_timeout=1, page_size=10)
+    monkeypatch.setattr(
+        client, "get", lambda endpoint, params=None, **kwargs: CappedPageResponse(params, with_total)
+    )
+    return client
+
+
+@pytest.mark.parametrize("stream", [False, True])
+@pytest.mark.parametrize("prefetch", [False, True])
+def test_paging_follows_total_records_past_short_pages(monkeypatch, stream, prefetch):
+    if stream and app.ijson is None:
+        pytest.skip("ijson is not installed")
+    client = capped_client(monkeypatch, with_total=True)
+    records = client.iter_collection("receipt-lines", "receiptLines", prefetch=prefetch, stream=stream)
+    assert list(records) == RECORDS
+
+
+def test_paging_without_total_records_stops_at_a_short_page(monkeypatch):
+    client = capped_client(monkeypatch, with_total=False)
+    assert list(client.iter_collection("receipt-lines", "receiptLines", prefetch=False)) == RECORDS[:2]
@@ -0,0 +1,56 @@
+from datetime import date
+
+import pytest
+
+import app
+from app import Investor, StagedSync, SyncState, SYNC_STATE_ID
+
+
+@pytest.fixture
+def published(session, monkeypatch):
+    monkeypatch.setattr(app.db, "session", session)
+    session.add(SyncState(id=SYNC_STATE_ID, generation=0, lease_holder=app.sync_worker_id()))
+    session.commit()
+    return session
+
+
+def staged_sync(balance):
+    investor = {
+        "name": "1 - Real Person",
+        "base_name": "Real Person",
+        "start_date": "2024-01-05",
+        "end_date": "2025-01-05",
+        "duration_months": 12,
+        "remaining_months": 0,
+        "profit_percentage": 12,
+        "balance": balance,
+        "monthly_profit": balance / 100,
+        "profit_payable_up_to_now": 0,
+        "profit_paid": 0,
+        "profit_due": 0,
+        "dividend_paid": 0,
+    }
+    return StagedSync([], [], "sync", 0, {"key-1": investor}, 0, date(2026, 10, 16))
+
+
+def test_publish_without_changes_keeps_the_generation(published):
+    first = app.publish_sync(staged_sync(1000))
+    state = published.get(SyncState, SYNC_STATE_ID)
+    published_at = state.published_at
+
+    again = app.publish_sync(staged_sync(1000))
+    state = published.get(SyncState, SYNC_STATE_ID, populate_existing=True)
+
+    assert first["changed"] and not again["changed"]
+    assert again["generation"] == first["generation"] == state.generation
+    assert state.published_at == published_at
+    assert state.checked_at >= published_at
+
+
+def test_publish_with_changes_advances_the_generation(published):
+    first = app.publish_sync(staged_sync(1000))
+    changed = app.publish_sync(staged_sync(2000))
+
+    assert changed["changed"]
+    assert changed["generation"] == first["generation"] + 1
+    assert published.query(Investor).one().balance == 2000
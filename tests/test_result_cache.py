@@ -0,0 +1,33 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app import SQLiteResultCache
+
+
+def test_sqlite_result_cache_shares_pooled_connections(tmp_path):
+    cache = SQLiteResultCache(str(tmp_path / "cache.db"), max_entries=8, pool_size=2)
+    cache.set("view", 1, ("text/html", b"<p>hi</p>"))
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(lambda _: cache.get("view"), range(64)))
+
+    assert results == [("text/html", b"<p>hi</p>")] * 64
+    assert cache._idle.qsize() <= 2
+
+
+def test_sqlite_result_cache_hit_only_touches_stale_entries(tmp_path, monkeypatch):
+    cache = SQLiteResultCache(str(tmp_path / "cache.db"), max_entries=8, pool_size=1)
+    cache.set("view", 1, ("text/html", b"body"))
+
+    def used_at():
+        with cache._connection() as conn:
+            return conn.execute("SELECT used_at FROM result_cache WHERE key = 'view'").fetchone()[0]
+
+    stored = used_at()
+    assert cache.get("view") == ("text/html", b"body")
+    assert used_at() == stored
+
+    later = stored + 3600
+    monkeypatch.setattr(time, "time", lambda: later)
+    assert cache.get("view") == ("text/html", b"body")
+    assert used_at() == later
@@ -0,0 +1,12 @@
+from app import SyncState, SYNC_STATE_ID
+
+
+def test_status_of_a_job_from_another_worker_reports_the_generation(client, session):
+    session.add(SyncState(id=SYNC_STATE_ID, generation=3))
+    session.commit()
+
+    response = client.get("/sync/status/queued-elsewhere")
+
+    assert response.status_code == 404
+    assert response.get_json()["error"] == "unknown job"
+    assert response.get_json()["generation"] == 3